@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-import random
+import asyncio
 import logging
 from datetime import datetime
 from itertools import cycle
@@ -14,6 +14,10 @@ import dns.asyncresolver
 import discord
 from discord.ext import tasks, commands
 
+from utils.http import create_session
+from utils.nodes import NodeRegistry
+from utils.coingecko import CoinGeckoClient
+
 import config
 
 if TYPE_CHECKING:
@@ -26,6 +30,7 @@ class RoboNerva(commands.AutoShardedBot):
     db: motor.MotorDatabase
     bot_app_info: discord.AppInfo
     session: aiohttp.ClientSession
+    coingecko: CoinGeckoClient
     log: logging.Logger
 
     def __init__(self):
@@ -44,39 +49,84 @@ class RoboNerva(commands.AutoShardedBot):
 
         self._launch_time: datetime = Any
         self._status_items: cycle = Any
-        self._seed_nodes: list[str] = list()
-        self._api_nodes: list[str] = list()
+        self._seed_nodes: tuple[str, ...] = tuple()
+        self.nodes: NodeRegistry = NodeRegistry()
 
-    @tasks.loop(hours=1)
-    async def _update_seed_nodes(self) -> None:
-        try:
-            answers = await dns.asyncresolver.resolve("seed.nerva.one", "TXT")
+    async def _resolve_nodes(self, record: str) -> tuple[tuple[str, ...], int]:
+        answers = await dns.asyncresolver.resolve(record, "TXT")
+
+        return (
+            tuple(rdata.to_text().strip('"') for rdata in answers),
+            answers.rrset.ttl,
+        )
+
+    def _publish_nodes(self, record: str, nodes: tuple[str, ...]) -> None:
+        if record == self.config.SEED_NODES_RECORD:
+            self._seed_nodes = nodes
 
-            self._seed_nodes.clear()
+        elif record == self.config.API_NODES_RECORD:
+            self.nodes.replace(nodes)
 
-            for rdata in answers:
-                self._seed_nodes.append(rdata.to_text().strip('"'))
+    async def _load_nodes(self) -> None:
+        try:
+            async for document in self.db["discovered_nodes"].find():
+                self._publish_nodes(document["_id"], tuple(document["nodes"]))
 
         except Exception as e:
-            self.log.exception("Failed to update seed nodes.", exc_info=e)
+            self.log.exception("Failed to load persisted nodes.", exc_info=e)
 
     @tasks.loop(hours=1)
-    async def _update_api_nodes(self) -> None:
-        try:
-            answers = await dns.asyncresolver.resolve("api_url.nerva.one", "TXT")
+    async def _discover_nodes(self) -> None:
+        records = (self.config.SEED_NODES_RECORD, self.config.API_NODES_RECORD)
+
+        results = await asyncio.gather(
+            *(self._resolve_nodes(record) for record in records),
+            return_exceptions=True,
+        )
 
-            self._api_nodes.clear()
+        ttls = list()
 
-            for rdata in answers:
-                self._api_nodes.append(rdata.to_text().strip('"'))
+        for record, result in zip(records, results):
+            if isinstance(result, BaseException):
+                self.log.exception(f"Failed to resolve {record}.", exc_info=result)
+                continue
 
-        except Exception as e:
-            self.log.exception("Failed to update seed nodes.", exc_info=e)
+            nodes, ttl = result
+
+            if not nodes:
+                continue
+
+            self._publish_nodes(record, nodes)
+            ttls.append(ttl)
+
+            try:
+                await self.db["discovered_nodes"].update_one(
+                    {"_id": record},
+                    {"$set": {"nodes": list(nodes), "updated_at": datetime.now()}},
+                    upsert=True,
+                )
+
+            except Exception as e:
+                self.log.exception("Failed to persist discovered nodes.", exc_info=e)
+
+        # Re-resolve when the shortest record expires, within sane bounds.
+        self._discover_nodes.change_interval(
+            seconds=min(
+                max(min(ttls, default=0), self.config.NODE_DISCOVERY_MIN_INTERVAL),
+                self.config.NODE_DISCOVERY_MAX_INTERVAL,
+            )
+        )
 
     async def setup_hook(self) -> None:
-        self.session = aiohttp.ClientSession()
+        self.session = create_session()
+        self.coingecko = CoinGeckoClient(self.session, self.config.COINGECKO_API_KEY)
         self.bot_app_info = await self.application_info()
 
+        # Warm start from the last good node sets so commands work before the
+        # first DNS lookup completes.
+        await self._load_nodes()
+        self._discover_nodes.start()
+
         for _extension in self.config.INITIAL_EXTENSIONS:
             try:
                 await self.load_extension(_extension)
@@ -94,9 +144,6 @@ class RoboNerva(commands.AutoShardedBot):
 
         await self.tree.sync(guild=discord.Object(id=self.config.COMMUNITY_GUILD_ID))
 
-        self._update_seed_nodes.start()
-        self._update_api_nodes.start()
-
         self.log.info("RoboNerva is ready.")
 
     async def on_message(self, message: discord.Message) -> None:
@@ -112,8 +159,7 @@ class RoboNerva(commands.AutoShardedBot):
         await super().start(config.DISCORD_TOKEN, reconnect=True)
 
     async def close(self) -> None:
-        self._update_seed_nodes.cancel()
-        self._update_api_nodes.cancel()
+        self._discover_nodes.cancel()
 
         await super().close()
         await self.session.close()
@@ -135,16 +181,19 @@ class RoboNerva(commands.AutoShardedBot):
         return self.bot_app_info.owner
 
     @property
-    def seed_nodes(self) -> list[str]:
+    def seed_nodes(self) -> tuple[str, ...]:
         return self._seed_nodes
 
     @property
     def api_nodes(self) -> list[str]:
-        return self._api_nodes
+        return self.nodes.urls
 
     @property
     def api_url(self) -> str:
-        return random.choice(self._api_nodes)
+        if (url := self.nodes.best()) is None:
+            raise RuntimeError("No API nodes are available.")
+
+        return url
 
     @discord.utils.cached_property
     def log_hook(self) -> discord.Webhook:
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING
 
 from datetime import UTC, time, datetime
 
-import aiohttp
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.error import TelegramError
 from dateutil.parser import parse
@@ -181,44 +180,33 @@ class AutoPost(commands.Cog):
 
         embed.title = f"{datetime.now(UTC).strftime('%b %d, %Y')} - Price Update"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&ids=nerva",
-                headers={"x-cg-demo-api-key": self.bot.config.COINGECKO_API_KEY},
-            ) as res:
-                data = await res.json()
+        data = await self.bot.coingecko.markets()
 
-                embed.add_field(
-                    name="Current Price", value=f"${data[0]['current_price']}"
-                )
-                embed.add_field(
-                    name="Last Updated",
-                    value=f"<t:{int(parse(data[0]['last_updated']).timestamp())}:R>",
-                )
-                embed.add_field(name="Market Cap", value=f"${data[0]['market_cap']}")
-                embed.add_field(
-                    name="Market Cap Rank", value=data[0]["market_cap_rank"]
-                )
-                embed.add_field(
-                    name="Market Cap Change (24h)",
-                    value=f"{round(float(data[0]['market_cap_change_percentage_24h']), 2)}%",
-                )
-                embed.add_field(name="24h High", value=f"${data[0]['high_24h']}")
-                embed.add_field(name="24h Low", value=f"${data[0]['low_24h']}")
-                embed.add_field(
-                    name="Price Change (24h)",
-                    value=f"{round(float(data[0]['price_change_percentage_24h']), 2)}%",
-                )
-                embed.add_field(
-                    name="24h Trading Volume", value=f"${data[0]['total_volume']}"
-                )
-                embed.add_field(
-                    name="Circulating Supply",
-                    value=f"{data[0]['circulating_supply']} XNV",
-                )
-                embed.add_field(
-                    name="Total Supply", value=f"{data[0]['total_supply']} XNV"
-                )
+        embed.add_field(name="Current Price", value=f"${data[0]['current_price']}")
+        embed.add_field(
+            name="Last Updated",
+            value=f"<t:{int(parse(data[0]['last_updated']).timestamp())}:R>",
+        )
+        embed.add_field(name="Market Cap", value=f"${data[0]['market_cap']}")
+        embed.add_field(name="Market Cap Rank", value=data[0]["market_cap_rank"])
+        embed.add_field(
+            name="Market Cap Change (24h)",
+            value=f"{round(float(data[0]['market_cap_change_percentage_24h']), 2)}%",
+        )
+        embed.add_field(name="24h High", value=f"${data[0]['high_24h']}")
+        embed.add_field(name="24h Low", value=f"${data[0]['low_24h']}")
+        embed.add_field(
+            name="Price Change (24h)",
+            value=f"{round(float(data[0]['price_change_percentage_24h']), 2)}%",
+        )
+        embed.add_field(
+            name="24h Trading Volume", value=f"${data[0]['total_volume']}"
+        )
+        embed.add_field(
+            name="Circulating Supply",
+            value=f"{data[0]['circulating_supply']} XNV",
+        )
+        embed.add_field(name="Total Supply", value=f"{data[0]['total_supply']} XNV")
 
         embed.set_footer(
             text="Powered by the CoinGecko API",
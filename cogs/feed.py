@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from telegram.error import TelegramError
+
+import discord
+from discord.ext import tasks, commands
+
+from utils.network import NetworkSnapshot
+
+if TYPE_CHECKING:
+    from bot import RoboNerva
+
+from config import BLOCK_FEED_INTERVAL
+
+
+class Feed(commands.Cog):
+    def __init__(self, bot: RoboNerva):
+        self.bot: RoboNerva = bot
+        self._blocks: list[dict[str, Any]] = list()
+        self._mempool: Optional[tuple[int, int]] = None
+        # Mempool size as of the last announcement, changes are measured from it.
+        self._announced_pool_size: Optional[int] = None
+
+    def cog_load(self) -> None:
+        if self.bot.config.BLOCK_FEED_CHANNEL_ID is not None:
+            self._flush_feed.start()
+
+    def cog_unload(self) -> None:
+        self._flush_feed.cancel()
+
+    @commands.Cog.listener()
+    async def on_network_snapshot(
+        self, previous: Optional[NetworkSnapshot], snapshot: NetworkSnapshot
+    ) -> None:
+        if self.bot.config.BLOCK_FEED_CHANNEL_ID is None:
+            return
+
+        # The cog may be loaded after the first snapshot, e.g. on a reload.
+        if previous is None or self._announced_pool_size is None:
+            self._announced_pool_size = snapshot.tx_pool_size
+
+        if previous is None:
+            return
+
+        if snapshot.top_block_hash != previous.top_block_hash:
+            header = snapshot.last_block_header
+
+            self._blocks.append(
+                {
+                    "height": header["height"],
+                    "hash": header["hash"],
+                    "num_txes": header["num_txes"],
+                    "reward": header["reward"] / 1e12,
+                    # Blocks found between two polls are only seen as the new tip.
+                    "count": max(1, snapshot.height - previous.height),
+                }
+            )
+
+        if (
+            abs(snapshot.tx_pool_size - self._announced_pool_size)
+            >= self.bot.config.BLOCK_FEED_MEMPOOL_THRESHOLD
+        ):
+            self._mempool = (self._announced_pool_size, snapshot.tx_pool_size)
+            self._announced_pool_size = snapshot.tx_pool_size
+
+    def _build_message(self) -> str:
+        lines = list()
+
+        if len(self._blocks) == 1 and self._blocks[0]["count"] == 1:
+            block = self._blocks[0]
+            lines.append(
+                f"New block {block['height']}: {block['num_txes']} transactions, "
+                f"{block['reward']} XNV reward"
+            )
+
+        elif self._blocks:
+            count = sum(block["count"] for block in self._blocks)
+            lines.append(f"{count} new blocks up to {self._blocks[-1]['height']}:")
+
+            # Keep the message short when the feed catches up on a long burst.
+            for block in self._blocks[-10:]:
+                lines.append(
+                    f"- {block['height']}: {block['num_txes']} transactions, "
+                    f"{block['reward']} XNV reward"
+                )
+
+        if self._mempool is not None:
+            before, after = self._mempool
+            lines.append(f"Mempool: {before} → {after} transactions")
+
+        return "\n".join(lines)
+
+    # Snapshot events only queue changes; this loop sends at most one message per
+    # interval, so a burst of blocks is announced together.
+    @tasks.loop(seconds=BLOCK_FEED_INTERVAL)
+    async def _flush_feed(self) -> None:
+        if not self._blocks and self._mempool is None:
+            return
+
+        message = self._build_message()
+
+        self._blocks.clear()
+        self._mempool = None
+
+        if channel := self.bot.get_channel(self.bot.config.BLOCK_FEED_CHANNEL_ID):
+            try:
+                await channel.send(message)
+
+            except discord.HTTPException as e:
+                self.bot.log.error(f"Failed to send block feed: {e}")
+
+        if self.bot.config.BLOCK_FEED_TELEGRAM:
+            try:
+                await self.bot.tg.send_message(
+                    chat_id=self.bot.config.TELEGRAM_CHAT_ID, text=message
+                )
+
+            except TelegramError as e:
+                self.bot.log.error(f"Telegram error: {e}")
+
+    @_flush_feed.before_loop
+    async def _before_flush_feed(self) -> None:
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: RoboNerva) -> None:
+    await bot.add_cog(Feed(bot))
@@ -5,13 +5,12 @@ from typing import TYPE_CHECKING
 import math
 from datetime import UTC, datetime
 
-import aiohttp
-
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from utils.cd import cooldown
+from utils.http import fetch_json
 
 from config import COMMUNITY_GUILD_ID
 
@@ -184,24 +183,23 @@ class General(commands.Cog):
 
         embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://api.github.com/repos/nerva-project/nerva/releases/latest",
-                headers={"Authorization": f"Bearer {self.bot.config.GITHUB_TOKEN}"},
-            ) as res:
-                data = await res.json()
+        data = await fetch_json(
+            self.bot.session,
+            "https://api.github.com/repos/nerva-project/nerva/releases/latest",
+            headers={"Authorization": f"Bearer {self.bot.config.GITHUB_TOKEN}"},
+        )
 
-                cli_version = data["tag_name"]
-                cli_prerelease = data["prerelease"]
+        cli_version = data["tag_name"]
+        cli_prerelease = data["prerelease"]
 
-            async with session.get(
-                "https://api.github.com/repos/nerva-project/NervaOneWalletMiner/releases/latest",
-                headers={"Authorization": f"Bearer {self.bot.config.GITHUB_TOKEN}"},
-            ) as res:
-                data = await res.json()
+        data = await fetch_json(
+            self.bot.session,
+            "https://api.github.com/repos/nerva-project/NervaOneWalletMiner/releases/latest",
+            headers={"Authorization": f"Bearer {self.bot.config.GITHUB_TOKEN}"},
+        )
 
-                gui_version = data["tag_name"]
-                gui_prerelease = data["prerelease"]
+        gui_version = data["tag_name"]
+        gui_prerelease = data["prerelease"]
 
         embed.description = (
             f"Latest CLI version: **{cli_version} "
@@ -45,14 +45,15 @@ class Help(commands.Cog):
         # Temporarily disable market commands until CoinGecko listing is back
         # embed.add_field(
         #     name="Market",
-        #     value=f"`/coingecko`, `/tradeogre`, `/xeggex`, `/history`",
+        #     value=f"`/coingecko`, `/market`, `/history`, `/chart`, `/stats`",
         #     inline=False,
         # )
 
         embed.add_field(
             name="Network",
-            value=f"`/info`, `/height`, `/difficulty`, `/hashrate`, `/supply`, `/seeds`, "
-            f"`/seed_info`, `/lastblock`, `/inflation`, `/bans`, `/ban` (\U00002b50), `/unban`, ",
+            value=f"`/info`, `/height`, `/difficulty`, `/hashrate`, `/blocktime`, `/supply`, "
+            f"`/seeds`, `/seed_info`, `/lastblock`, `/block`, `/tx`, `/inflation`, "
+            f"`/networkhistory`, `/nodes`, `/bans`, `/ban` (\U00002b50), `/banbulk` (\U00002b50), `/unban` (\U00002b50), ",
             inline=False,
         )
 
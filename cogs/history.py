@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+from datetime import UTC, datetime, timedelta
+
+import discord
+from discord import app_commands
+from discord.ext import tasks, commands
+
+from utils.cd import cooldown
+from utils.tools import format_hashrate
+
+if TYPE_CHECKING:
+    from bot import RoboNerva
+
+from config import COMMUNITY_GUILD_ID
+
+
+class History(commands.Cog):
+    METRICS = ("height", "difficulty", "hashrate", "connections", "supply")
+
+    # Collection name and retention of each resolution.
+    RESOLUTIONS = {
+        "minute": ("network_metrics", timedelta(days=2)),
+        "hour": ("network_metrics_hourly", timedelta(days=90)),
+        "day": ("network_metrics_daily", timedelta(days=3650)),
+    }
+
+    PERIODS = {
+        "24h": (timedelta(hours=24), "hour"),
+        "7d": (timedelta(days=7), "hour"),
+        "30d": (timedelta(days=30), "day"),
+        "1y": (timedelta(days=365), "day"),
+    }
+
+    # Trailing windows over which supply emission is measured.
+    EMISSION_WINDOWS = {
+        "day": (timedelta(days=1), "hour"),
+        "month": (timedelta(days=30), "day"),
+        "year": (timedelta(days=365), "day"),
+    }
+
+    def __init__(self, bot: RoboNerva):
+        self.bot: RoboNerva = bot
+        self.baselines: dict[str, dict[str, Any]] = dict()
+        self.supply_baselines: dict[str, tuple[datetime, float]] = dict()
+        self._baseline_hour: Optional[datetime] = None
+
+    async def cog_load(self) -> None:
+        name, retention = self.RESOLUTIONS["minute"]
+
+        if name not in await self.bot.db.list_collection_names():
+            await self.bot.db.create_collection(
+                name,
+                timeseries={"timeField": "timestamp", "granularity": "minutes"},
+                expireAfterSeconds=int(retention.total_seconds()),
+            )
+
+        for resolution in ("hour", "day"):
+            name, retention = self.RESOLUTIONS[resolution]
+
+            await self.bot.db[name].create_index(
+                "timestamp", expireAfterSeconds=int(retention.total_seconds())
+            )
+
+        self._sample_network.start()
+
+    def cog_unload(self) -> None:
+        self._sample_network.cancel()
+
+    @staticmethod
+    def _bucket(timestamp: datetime, resolution: str) -> datetime:
+        if resolution == "hour":
+            return timestamp.replace(minute=0, second=0, microsecond=0)
+
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    async def _rollup(
+        self, timestamp: datetime, sample: dict[str, float], resolution: str
+    ) -> None:
+        bucket = self._bucket(timestamp, resolution)
+
+        await self.bot.db[self.RESOLUTIONS[resolution][0]].update_one(
+            {"_id": bucket},
+            {
+                # `first_at` is when the opening values were sampled, which can be
+                # well after the bucket starts.
+                "$setOnInsert": {"timestamp": bucket, "first_at": timestamp}
+                | {f"{metric}.open": value for metric, value in sample.items()},
+                "$set": {
+                    f"{metric}.close": value for metric, value in sample.items()
+                },
+                "$min": {f"{metric}.min": value for metric, value in sample.items()},
+                "$max": {f"{metric}.max": value for metric, value in sample.items()},
+                "$inc": {"count": 1},
+            },
+            upsert=True,
+        )
+
+    async def _refresh_baselines(self, now: datetime) -> None:
+        collection = self.bot.db[self.RESOLUTIONS["hour"][0]]
+
+        for period in ("24h", "7d"):
+            bucket = self._bucket(now - self.PERIODS[period][0], "hour")
+
+            if document := await collection.find_one({"_id": bucket}):
+                self.baselines[period] = document
+
+        # The oldest sample within each window, so emission is still measured over
+        # what is available while history is shorter than the window.
+        for window, (delta, resolution) in self.EMISSION_WINDOWS.items():
+            document = await self.bot.db[self.RESOLUTIONS[resolution][0]].find_one(
+                {"_id": {"$gte": self._bucket(now - delta, resolution)}},
+                sort=[("_id", 1)],
+            )
+
+            if document and document.get("supply"):
+                self.supply_baselines[window] = (
+                    document.get("first_at", document["timestamp"]).replace(
+                        tzinfo=UTC
+                    ),
+                    document["supply"]["open"],
+                )
+
+    @tasks.loop(minutes=1)
+    async def _sample_network(self) -> None:
+        network = self.bot.get_cog("Network")
+
+        if network is None or (snapshot := network.snapshot) is None:
+            return
+
+        now = datetime.now(UTC)
+
+        sample = {
+            "height": snapshot.height,
+            "difficulty": snapshot.difficulty,
+            "hashrate": network.hashrate(snapshot),
+            "connections": snapshot.incoming_connections_count
+            + snapshot.outgoing_connections_count,
+            "supply": float(snapshot.supply),
+        }
+
+        try:
+            await self.bot.db[self.RESOLUTIONS["minute"][0]].insert_one(
+                {"timestamp": now, **sample}
+            )
+
+            await self._rollup(now, sample, "hour")
+            await self._rollup(now, sample, "day")
+
+            if self._baseline_hour != (hour := self._bucket(now, "hour")):
+                await self._refresh_baselines(now)
+                self._baseline_hour = hour
+
+        except Exception as e:
+            self.bot.log.exception("Failed to store network metrics.", exc_info=e)
+
+    @_sample_network.before_loop
+    async def _before_sample_network(self) -> None:
+        await self.bot.wait_until_ready()
+
+    def emission(
+        self, window: str, supply: float
+    ) -> Optional[tuple[float, timedelta]]:
+        """Return the supply emitted over a trailing window and the time it took."""
+        if (baseline := self.supply_baselines.get(window)) is None:
+            return None
+
+        timestamp, previous = baseline
+        elapsed = datetime.now(UTC) - timestamp
+
+        if elapsed <= timedelta(0):
+            return None
+
+        return supply - previous, elapsed
+
+    def format_changes(self, metric: str, value: float) -> str:
+        """Describe the 24h and 7d change of a metric, e.g. ` (24h: +1.20%)`."""
+        changes = list()
+
+        for period, document in self.baselines.items():
+            if not (previous := document.get(metric, {}).get("close")):
+                continue
+
+            changes.append(f"{period}: {(value - previous) / previous * 100:+.2f}%")
+
+        return f" ({', '.join(changes)})" if changes else ""
+
+    @app_commands.command(name="networkhistory")
+    @app_commands.guilds(COMMUNITY_GUILD_ID)
+    @app_commands.checks.dynamic_cooldown(cooldown)
+    async def _network_history(
+        self,
+        ctx: discord.Interaction,
+        period: Literal["24h", "7d", "30d", "1y"] = "24h",
+    ):
+        """Shows how the network has changed over a period of time.
+
+        Parameters
+        ----------
+        period : str
+            The period to show the history for.
+
+        """
+        # noinspection PyUnresolvedReferences
+        await ctx.response.defer(thinking=True)
+
+        delta, resolution = self.PERIODS[period]
+        start = self._bucket(datetime.now(UTC) - delta, resolution)
+
+        group: dict[str, Any] = {"_id": None, "buckets": {"$sum": 1}}
+
+        for metric in self.METRICS:
+            group[f"{metric}_open"] = {"$first": f"${metric}.open"}
+            group[f"{metric}_close"] = {"$last": f"${metric}.close"}
+            group[f"{metric}_min"] = {"$min": f"${metric}.min"}
+            group[f"{metric}_max"] = {"$max": f"${metric}.max"}
+
+        result = await (
+            self.bot.db[self.RESOLUTIONS[resolution][0]]
+            .aggregate(
+                [
+                    {"$match": {"_id": {"$gte": start}}},
+                    {"$sort": {"_id": 1}},
+                    {"$group": group},
+                ]
+            )
+            .to_list(length=1)
+        )
+
+        if not result:
+            return await ctx.edit_original_response(
+                content="No network history available yet."
+            )
+
+        data = result[0]
+
+        embed = discord.Embed(color=self.bot.embed_color)
+        embed.title = f"Nerva Network History ({period})"
+
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        for metric in self.METRICS:
+            opening, closing = data[f"{metric}_open"], data[f"{metric}_close"]
+
+            if opening is None or closing is None:
+                continue
+
+            fmt = format_hashrate if metric == "hashrate" else lambda v: f"{v:,.0f}"
+            change = (
+                f" ({(closing - opening) / opening * 100:+.2f}%)" if opening else ""
+            )
+
+            embed.add_field(
+                name=metric.capitalize(),
+                value=f"{fmt(opening)} → {fmt(closing)}{change}\n"
+                f"Low: {fmt(data[f'{metric}_min'])}\n"
+                f"High: {fmt(data[f'{metric}_max'])}",
+            )
+
+        embed.set_footer(
+            text=f"Aggregated from {data['buckets']} {resolution} buckets"
+        )
+
+        await ctx.edit_original_response(embed=embed)
+
+
+async def setup(bot: RoboNerva) -> None:
+    await bot.add_cog(History(bot))
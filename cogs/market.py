@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
+import io
+import asyncio
+import multiprocessing
 from datetime import UTC, time, datetime, timedelta
+from statistics import median
+from concurrent.futures import ProcessPoolExecutor
 
-import aiohttp
 from dateutil.parser import parse
 
 import discord
@@ -13,6 +17,11 @@ from discord.ext import tasks, commands
 from discord.ext.menus.views import ViewMenuPages
 
 from utils.cd import cooldown
+from utils.cache import LRUCache
+from utils.chart import render_chart
+from utils.market import ADAPTERS, MarketAggregator
+from utils.candles import Candle, CandleBuilder
+from utils.analytics import PriceHistory
 from utils.paginators import (
     NervaExchangePaginatorSource,
     HistoricalPricePaginatorSource,
@@ -21,95 +30,218 @@ from utils.paginators import (
 if TYPE_CHECKING:
     from bot import RoboNerva
 
-from config import COMMUNITY_GUILD_ID, MARKET_HISTORY_HOURS_AFTER_UTC
+from config import (
+    CHART_CACHE_SIZE,
+    COMMUNITY_GUILD_ID,
+    PRICE_TICK_INTERVAL,
+    CHART_RENDER_WORKERS,
+    MARKET_REFRESH_INTERVAL,
+    MARKET_HISTORY_HOURS_AFTER_UTC,
+)
 
 
 class Market(commands.Cog):
-    BASE_API_URL = "https://nervaapi.sn1f3rt.dev/market"
+    CANDLE_COLLECTIONS = {
+        "hour": "xnv_historical_price_data_hourly",
+        "day": "xnv_historical_price_data",
+    }
+    CANDLE_FIELDS = ("opening", "closing", "high", "low", "volume")
+    RESOLUTION_PERIODS = {
+        "hour": timedelta(hours=1),
+        "day": timedelta(days=1),
+        "week": timedelta(weeks=1),
+        "month": timedelta(days=28),
+    }
+    CHART_RANGES = {
+        "7d": timedelta(days=7),
+        "30d": timedelta(days=30),
+        "90d": timedelta(days=90),
+        "1y": timedelta(days=365),
+        "all": None,
+    }
 
     def __init__(self, bot: RoboNerva):
         self.bot: RoboNerva = bot
+        self.aggregator: MarketAggregator = MarketAggregator(
+            bot.session,
+            [ADAPTERS[name](bot.config) for name in bot.config.MARKET_EXCHANGES],
+        )
+        self.candles: dict[str, CandleBuilder] = {
+            resolution: CandleBuilder(resolution)
+            for resolution in self.CANDLE_COLLECTIONS
+        }
+        # Forking a process with a running event loop and open sockets is unsafe,
+        # so workers start from a clean server process instead.
+        self._chart_pool: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=CHART_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+        self._charts: LRUCache[tuple, bytes] = LRUCache(CHART_CACHE_SIZE)
+        self.price_history: PriceHistory = PriceHistory()
+
+    @tasks.loop(seconds=MARKET_REFRESH_INTERVAL)
+    async def _refresh_markets(self) -> None:
+        errors = await self.aggregator.refresh()
+
+        for exchange, error in errors.items():
+            self.bot.log.warning(f"Failed to refresh {exchange} market: {error!r}")
 
-    async def _fetch_market(self, exchange: str) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_API_URL}/{exchange}") as res:
-                data = await res.json()
+        if len(errors) < len(self.aggregator.adapters):
+            self.bot.dispatch("market_refresh")
+
+    @_refresh_markets.before_loop
+    async def _before_refresh_markets(self) -> None:
+        await self.bot.wait_until_ready()
+
+    async def _sample_price(self) -> tuple[Optional[float], Optional[float]]:
+        """Return the median USD price across sources and the 24h volume."""
+        prices, volume = list(), None
+
+        try:
+            data = (await self.bot.coingecko.markets())[0]
+            prices.append(float(data["current_price"]))
+            volume = float(data["total_volume"])
+
+        except Exception as e:
+            self.bot.log.warning(f"Failed to sample CoinGecko price: {e!r}")
+
+        for exchange, pair in self.bot.config.PRICE_TICK_PAIRS:
+            if (ticker := self.aggregator.ticker(exchange, pair)) is None:
+                continue
+
+            try:
+                prices.append(float(ticker.last_price))
+
+            except (TypeError, ValueError):
+                continue
+
+        return (median(prices) if prices else None), volume
+
+    async def _flush_candle(self, resolution: str, candle: Candle) -> None:
+        # Merge rather than insert, so a candle split by a restart is combined.
+        await self.bot.db[self.CANDLE_COLLECTIONS[resolution]].update_one(
+            {"_id": candle.start},
+            {
+                "$setOnInsert": {"opening": round(candle.open, 4)},
+                "$max": {"high": round(candle.high, 4)},
+                "$min": {"low": round(candle.low, 4)},
+                "$set": {
+                    "closing": round(candle.close, 4),
+                    "volume": (
+                        round(candle.volume, 2)
+                        if candle.volume is not None
+                        else None
+                    ),
+                },
+            },
+            upsert=True,
+        )
 
-                if data.get("status") != "success":
-                    raise RuntimeError(f"API error for {exchange}")
+    @tasks.loop(minutes=PRICE_TICK_INTERVAL)
+    async def _ingest_price(self) -> None:
+        try:
+            price, volume = await self._sample_price()
 
-                return data
+            if price is None:
+                return
 
+            now = datetime.now(UTC)
+
+            for resolution, builder in self.candles.items():
+                # CoinGecko only reports a rolling 24h volume, which means
+                # nothing for an hour, so only daily candles carry it.
+                if finished := builder.add(
+                    now, price, volume if resolution == "day" else None
+                ):
+                    await self._flush_candle(resolution, finished)
+
+                    if resolution == "day":
+                        self.price_history.append(
+                            finished.start, round(finished.close, 4)
+                        )
+
+                # Upsert the candle being built too, so a restart does not lose it.
+                await self._flush_candle(resolution, builder.current)
+
+        except Exception as e:
+            self.bot.log.exception("Failed to ingest price tick.", exc_info=e)
+
+    @_ingest_price.before_loop
+    async def _before_ingest_price(self) -> None:
+        await self.bot.wait_until_ready()
+
+    # Daily candles normally come from the tick ingester. This only rebuilds a day
+    # from CoinGecko if it is missing, e.g. when the bot was down at midnight.
     @tasks.loop(time=time(hour=MARKET_HISTORY_HOURS_AFTER_UTC))
     async def _store_historical_data(self):
-        yesterday_date = datetime.now(UTC) - timedelta(days=1)
-
-        start_timestamp = int(
-            yesterday_date.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ).timestamp()
-        )
-        end_timestamp = int(
-            (yesterday_date + timedelta(days=1))
-            .replace(hour=0, minute=0, second=0, microsecond=0)
-            .timestamp()
-        )
-
-        params = {"vs_currency": "usd", "from": start_timestamp, "to": end_timestamp}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://api.coingecko.com/api/v3/coins/nerva/market_chart/range",
-                headers={"x-cg-demo-api-key": self.bot.config.COINGECKO_API_KEY},
-                params=params,
-            ) as res:
-                data = await res.json()
-
-                collection = self.bot.db["xnv_historical_price_data"]
-
-                if "prices" not in data:
-                    opening_price = None
-                    closing_price = None
-                    high_price = None
-                    low_price = None
-                    volume = None
-
-                else:
-                    prices = data["prices"]
-                    volumes = data["total_volumes"]
-
-                    opening_price = prices[0][1]
-                    closing_price = prices[-1][1]
-                    high_price = max([price[1] for price in prices])
-                    low_price = min([price[1] for price in prices])
-                    volume = volumes[0][1]
-
-                await collection.insert_one(
-                    {
-                        "_id": yesterday_date.replace(
-                            hour=0, minute=0, second=0, microsecond=0
-                        ),
-                        "opening": round(opening_price, 4),
-                        "closing": round(closing_price, 4),
-                        "high": round(high_price, 4),
-                        "low": round(low_price, 4),
-                        "volume": round(volume, 2),
-                    }
-                )
+        yesterday_date = (datetime.now(UTC) - timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
 
-                self.bot.log.info(
-                    f"Stored historical data for {yesterday_date.strftime('%Y-%m-%d')}"
-                )
+        collection = self.bot.db["xnv_historical_price_data"]
+
+        if await collection.find_one({"_id": yesterday_date}):
+            return
+
+        data = await self.bot.coingecko.market_chart_range(
+            int(yesterday_date.timestamp()),
+            int((yesterday_date + timedelta(days=1)).timestamp()),
+        )
+
+        if not data.get("prices"):
+            self.bot.log.warning(
+                f"No historical data for {yesterday_date.strftime('%Y-%m-%d')}"
+            )
+            return
+
+        prices = [price[1] for price in data["prices"]]
+
+        await collection.insert_one(
+            {
+                "_id": yesterday_date,
+                "opening": round(prices[0], 4),
+                "closing": round(prices[-1], 4),
+                "high": round(max(prices), 4),
+                "low": round(min(prices), 4),
+                "volume": round(data["total_volumes"][0][1], 2),
+            }
+        )
+
+        self.price_history.append(yesterday_date, round(prices[-1], 4))
+
+        self.bot.log.info(
+            f"Stored historical data for {yesterday_date.strftime('%Y-%m-%d')}"
+        )
 
     @_store_historical_data.before_loop
     async def _before_store_historical_data(self):
         await self.bot.wait_until_ready()
 
-    def cog_load(self) -> None:
+    async def cog_load(self) -> None:
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Today's candle is still being built, so it only joins once finished.
+        documents = (
+            await self.bot.db[self.CANDLE_COLLECTIONS["day"]]
+            .find({"_id": {"$lt": today}}, projection={"closing": 1})
+            .sort("_id", 1)
+            .to_list(length=None)
+        )
+
+        self.price_history.load(
+            {**document, "_id": document["_id"].replace(tzinfo=UTC)}
+            for document in documents
+        )
+
+        self._refresh_markets.start()
+        self._ingest_price.start()
         self._store_historical_data.start()
 
     def cog_unload(self) -> None:
+        self._refresh_markets.cancel()
+        self._ingest_price.cancel()
         self._store_historical_data.cancel()
+        self._chart_pool.shutdown(wait=False, cancel_futures=True)
 
     @app_commands.command(name="coingecko")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
@@ -128,50 +260,41 @@ class Market(commands.Cog):
             "q=tbn:ANd9GcT9xV6Ut4_LMNqb9umIAXW3eu7-unDOiLeNjg&s"
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&ids=nerva",
-                headers={"x-cg-demo-api-key": self.bot.config.COINGECKO_API_KEY},
-            ) as res:
-                data = await res.json()
+        data = await self.bot.coingecko.markets()
 
-                embed.add_field(
-                    name="Current Price",
-                    value=f"${round(float(data[0]['current_price']), 4)}",
-                )
-                embed.add_field(
-                    name="Last Updated",
-                    value=f"<t:{int(parse(data[0]['last_updated']).timestamp())}:R>",
-                )
-                embed.add_field(name="Market Cap", value=f"${data[0]['market_cap']}")
-                embed.add_field(
-                    name="Market Cap Rank", value=data[0]["market_cap_rank"]
-                )
-                embed.add_field(
-                    name="Market Cap Change (24h)",
-                    value=f"{round(float(data[0]['market_cap_change_percentage_24h']), 2)}%",
-                )
-                embed.add_field(
-                    name="24h High", value=f"${round(float(data[0]['high_24h']), 4)}"
-                )
-                embed.add_field(
-                    name="24h Low", value=f"${round(float(data[0]['low_24h']), 4)}"
-                )
-                embed.add_field(
-                    name="Price Change (24h)",
-                    value=f"{round(float(data[0]['price_change_percentage_24h']), 2)}%",
-                )
-                embed.add_field(
-                    name="24h Trading Volume",
-                    value=f"${round(float(data[0]['total_volume']), 4)}",
-                )
-                embed.add_field(
-                    name="Circulating Supply",
-                    value=f"{data[0]['circulating_supply']} XNV",
-                )
-                embed.add_field(
-                    name="Total Supply", value=f"{data[0]['total_supply']} XNV"
-                )
+        embed.add_field(
+            name="Current Price",
+            value=f"${round(float(data[0]['current_price']), 4)}",
+        )
+        embed.add_field(
+            name="Last Updated",
+            value=f"<t:{int(parse(data[0]['last_updated']).timestamp())}:R>",
+        )
+        embed.add_field(name="Market Cap", value=f"${data[0]['market_cap']}")
+        embed.add_field(name="Market Cap Rank", value=data[0]["market_cap_rank"])
+        embed.add_field(
+            name="Market Cap Change (24h)",
+            value=f"{round(float(data[0]['market_cap_change_percentage_24h']), 2)}%",
+        )
+        embed.add_field(
+            name="24h High", value=f"${round(float(data[0]['high_24h']), 4)}"
+        )
+        embed.add_field(
+            name="24h Low", value=f"${round(float(data[0]['low_24h']), 4)}"
+        )
+        embed.add_field(
+            name="Price Change (24h)",
+            value=f"{round(float(data[0]['price_change_percentage_24h']), 2)}%",
+        )
+        embed.add_field(
+            name="24h Trading Volume",
+            value=f"${round(float(data[0]['total_volume']), 4)}",
+        )
+        embed.add_field(
+            name="Circulating Supply",
+            value=f"{data[0]['circulating_supply']} XNV",
+        )
+        embed.add_field(name="Total Supply", value=f"{data[0]['total_supply']} XNV")
 
         embed.set_footer(
             text="Powered by the CoinGecko API",
@@ -189,40 +312,50 @@ class Market(commands.Cog):
 
         await ctx.edit_original_response(embed=embed, view=view)
 
-    @app_commands.command(name="nonkyc")
+    async def _exchange_autocomplete(
+        self, ctx: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        return [
+            app_commands.Choice(name=adapter.display_name, value=adapter.name)
+            for adapter in self.aggregator.adapters.values()
+            if current.lower() in adapter.display_name.lower()
+        ]
+
+    @app_commands.command(name="market")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
-    async def _nonkyc(self, ctx: discord.Interaction):
-        """Shows the current Nerva market data from NonKYC."""
-        # noinspection PyUnresolvedReferences
-        await ctx.response.defer(thinking=True)
+    @app_commands.autocomplete(exchange=_exchange_autocomplete)
+    async def _market(self, ctx: discord.Interaction, exchange: str):
+        """Shows the current Nerva market data from an exchange.
 
-        api_data = await self._fetch_market("nonkyc")
+        Parameters
+        ----------
+        exchange : str
+            The exchange to show the market data for.
 
-        market_data: List[Dict] = list()
+        """
+        # noinspection PyUnresolvedReferences
+        await ctx.response.defer(thinking=True)
 
-        for pair in self.bot.config.NONKYC_MARKET_PAIRS:
-            entry = api_data["result"][pair]
+        if (adapter := self.aggregator.adapters.get(exchange)) is None:
+            return await ctx.edit_original_response(
+                content=f"Unknown exchange. Available exchanges: "
+                f"{', '.join(self.aggregator.adapters)}"
+            )
 
-            market_data.append(
-                {
-                    "pair": pair,
-                    "last_price": entry["last_price"],
-                    "bid": entry["bid"],
-                    "ask": entry["ask"],
-                    "volume": entry["volume"],
-                    "high": entry["high"],
-                    "low": entry["low"],
-                    "last_trade": int(parse(entry["last_trade"]).timestamp()),
-                }
+        if (snapshot := self.aggregator.get(exchange)) is None:
+            return await ctx.edit_original_response(
+                content=f"Market data from {adapter.display_name} is not "
+                f"available yet."
             )
 
         pages = NervaExchangePaginatorSource(
-            entries=market_data,
+            entries=list(snapshot.tickers.values()),
             ctx=ctx,
-            exchange_name="NonKYC",
-            exchange_urls=self.bot.config.NONKYC_MARKET_LINKS,
-            thumbnail_url="https://nonkyc.io/images/mediakit/NonKYC-logo-384.png",
+            exchange_name=adapter.display_name,
+            exchange_urls=adapter.links,
+            thumbnail_url=adapter.thumbnail_url,
+            fetched_at=snapshot.fetched_at,
         )
 
         paginator = ViewMenuPages(
@@ -235,39 +368,124 @@ class Market(commands.Cog):
         await ctx.edit_original_response(content="\U0001f44c")
         await paginator.start(ctx)
 
-    @app_commands.command(name="cexswap")
+    def _history_pipeline(
+        self, start: datetime, end: datetime, resolution: str
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Return the collection and aggregation pipeline for a history range."""
+        match = {"$match": {"_id": {"$gte": start, "$lt": end}}}
+
+        if resolution in self.CANDLE_COLLECTIONS:
+            return self.CANDLE_COLLECTIONS[resolution], [
+                match,
+                {"$sort": {"_id": -1}},
+                {
+                    "$project": {
+                        field: 1
+                        for field in self.CANDLE_FIELDS
+                        # Hourly candles have no volume of their own.
+                        if resolution != "hour" or field != "volume"
+                    }
+                },
+            ]
+
+        # Weekly and monthly candles are grouped from daily ones on the server.
+        return self.CANDLE_COLLECTIONS["day"], [
+            match,
+            {"$sort": {"_id": 1}},
+            {
+                "$group": {
+                    "_id": {
+                        "$dateTrunc": {
+                            "date": "$_id",
+                            "unit": resolution,
+                            "startOfWeek": "monday",
+                        }
+                    },
+                    "opening": {"$first": "$opening"},
+                    "closing": {"$last": "$closing"},
+                    "high": {"$max": "$high"},
+                    "low": {"$min": "$low"},
+                    "volume": {"$sum": "$volume"},
+                }
+            },
+            {"$sort": {"_id": -1}},
+        ]
+
+    @app_commands.command(name="history")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
-    async def _cexswap(self, ctx: discord.Interaction):
-        """Shows the current Nerva market data from CexSwap."""
+    async def _history(
+        self,
+        ctx: discord.Interaction,
+        days: int = 7,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        resolution: Literal["hour", "day", "week", "month"] = "day",
+    ):
+        """Shows the historical Nerva market data.
+
+        Parameters
+        ----------
+        days : int
+            The number of days to show, counted back from the end date.
+        start : str
+            The start date of the range (eg: 2024-01-01). Overrides days.
+        end : str
+            The last date of the range, inclusive (eg: 2024-12-31). Defaults to now.
+        resolution : str
+            The period covered by each entry.
+
+        """
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        api_data = await self._fetch_market("cexswap")
+        try:
+            end_date = parse(end).replace(tzinfo=UTC) if end else datetime.now(UTC)
 
-        market_data: List[Dict] = list()
+            # A bare date means the whole day, while the range excludes its end.
+            if end and end_date.time() == time.min:
+                end_date += timedelta(days=1)
 
-        for pair in self.bot.config.CEXSWAP_MARKET_PAIRS:
-            entry = api_data["result"][pair]
+            start_date = (
+                parse(start).replace(tzinfo=UTC)
+                if start
+                else end_date - timedelta(days=days)
+            )
 
-            market_data.append(
-                {
-                    "pair": pair,
-                    "last_price": entry["last_price"],
-                    "volume": entry["volume"],
-                    "high": entry["high"],
-                    "low": entry["low"],
-                }
+        except (ValueError, OverflowError):
+            return await ctx.edit_original_response(
+                content="Please provide dates in the YYYY-MM-DD format."
             )
 
-        pages = NervaExchangePaginatorSource(
-            entries=market_data,
+        if start_date >= end_date:
+            return await ctx.edit_original_response(
+                content="The start date must be before the end date."
+            )
+
+        name, pipeline = self._history_pipeline(start_date, end_date, resolution)
+        collection = self.bot.db[name]
+
+        # An upper bound from the range and the collection's metadata, so no
+        # count query has to scan the range.
+        total = (end_date - start_date) // self.RESOLUTION_PERIODS[resolution] + 1
+
+        if resolution in self.CANDLE_COLLECTIONS:
+            total = min(total, await collection.estimated_document_count())
+
+        pages = HistoricalPricePaginatorSource(
+            cursor=collection.aggregate(pipeline, batchSize=50),
             ctx=ctx,
-            exchange_name="CexSwap",
-            exchange_urls=self.bot.config.CEXSWAP_MARKET_LINKS,
-            thumbnail_url="https://cexswap.cc/icons/favicon-32x32.png",
+            total=total,
+            resolution=resolution,
         )
 
+        await pages.prepare()
+
+        if pages.empty:
+            return await ctx.edit_original_response(
+                content="No historical data available for this range."
+            )
+
         paginator = ViewMenuPages(
             source=pages,
             timeout=300,
@@ -278,90 +496,174 @@ class Market(commands.Cog):
         await ctx.edit_original_response(content="\U0001f44c")
         await paginator.start(ctx)
 
-    @app_commands.command(name="noirtrade")
+    @app_commands.command(name="chart")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
-    async def _noirtrade(self, ctx: discord.Interaction):
-        """Shows the current Nerva market data from NoirTrade."""
+    async def _chart(
+        self,
+        ctx: discord.Interaction,
+        period: Literal["7d", "30d", "90d", "1y", "all"] = "30d",
+        resolution: Literal["hour", "day", "week", "month"] = "day",
+        style: Literal["candlestick", "line"] = "candlestick",
+    ):
+        """Shows a chart of the Nerva price and volume.
+
+        Parameters
+        ----------
+        period : str
+            The period to chart.
+        resolution : str
+            The period covered by each candle.
+        style : str
+            Draw candlesticks or a line of closing prices.
+
+        """
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        api_data = await self._fetch_market("noirtrade")
+        end = datetime.now(UTC)
+        start = (
+            end - delta
+            if (delta := self.CHART_RANGES[period])
+            else datetime(1970, 1, 1, tzinfo=UTC)
+        )
 
-        market_data: List[Dict] = list()
+        name, pipeline = self._history_pipeline(start, end, resolution)
 
-        for pair in self.bot.config.NOIRTRADE_MARKET_PAIRS:
-            entry = api_data["result"][pair]
+        documents = [
+            document
+            async for document in self.bot.db[name].aggregate(pipeline)
+            if document["closing"] is not None
+        ][::-1]
 
-            market_data.append(
-                {
-                    "pair": pair,
-                    "last_price": entry["last_price"],
-                    "bid": entry["bid"],
-                    "ask": entry["ask"],
-                    "volume": entry["volume"],
-                    "high": entry["high"],
-                    "low": entry["low"],
-                }
+        if len(documents) < 2:
+            return await ctx.edit_original_response(
+                content="Not enough historical data available for this chart."
             )
 
-        pages = NervaExchangePaginatorSource(
-            entries=market_data,
-            ctx=ctx,
-            exchange_name="NoirTrade",
-            exchange_urls=self.bot.config.NOIRTRADE_MARKET_LINKS,
-            thumbnail_url="https://noirtrade.com/logo.png",
+        # Only a new tick changes the chart, since the latest candle is upserted
+        # as it is built, so repeat requests in between reuse the rendered image.
+        key = (
+            period,
+            resolution,
+            style,
+            documents[-1]["_id"],
+            documents[-1]["closing"],
         )
 
-        paginator = ViewMenuPages(
-            source=pages,
-            timeout=300,
-            delete_message_after=False,
-            clear_reactions_after=True,
+        if (image := self._charts.get(key)) is None:
+            candles = [
+                (
+                    document["opening"],
+                    document["high"],
+                    document["low"],
+                    document["closing"],
+                    document.get("volume"),
+                )
+                for document in documents
+            ]
+
+            image = await asyncio.get_running_loop().run_in_executor(
+                self._chart_pool, render_chart, candles, style
+            )
+            self._charts.set(key, image)
+
+        first, last = documents[0], documents[-1]
+        change = (
+            (last["closing"] - first["opening"]) / first["opening"] * 100
+            if first["opening"]
+            else 0.0
         )
 
-        await ctx.edit_original_response(content="\U0001f44c")
-        await paginator.start(ctx)
+        embed = discord.Embed(colour=self.bot.embed_color)
+        embed.title = f"Nerva Price Chart ({period}, {resolution})"
+        embed.set_image(url="attachment://chart.png")
 
-    @app_commands.command(name="history")
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        embed.add_field(name="Open", value=f"${first['opening']}")
+        embed.add_field(name="Close", value=f"${last['closing']}")
+        embed.add_field(name="Change", value=f"{change:+.2f}%")
+        embed.add_field(
+            name="High", value=f"${max(document['high'] for document in documents)}"
+        )
+        embed.add_field(
+            name="Low", value=f"${min(document['low'] for document in documents)}"
+        )
+
+        embed.set_footer(
+            text=f"{first['_id'].strftime('%Y-%m-%d')} to "
+            f"{last['_id'].strftime('%Y-%m-%d')} | {len(documents)} candles"
+        )
+
+        await ctx.edit_original_response(
+            embed=embed,
+            attachments=[discord.File(io.BytesIO(image), filename="chart.png")],
+        )
+
+    @app_commands.command(name="stats")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
-    async def _history(self, ctx: discord.Interaction, days: int = 7):
-        """Shows the historical Nerva market data."""
+    async def _stats(self, ctx: discord.Interaction):
+        """Shows statistics of the Nerva price history."""
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        collection = self.bot.db["xnv_historical_price_data"]
+        history = self.price_history
 
-        if (await collection.count_documents({})) == 0:
+        if len(history) < 2:
             return await ctx.edit_original_response(
-                content="No historical data available yet."
+                content="Not enough historical data available yet."
             )
 
-        entries = list()
+        def _price(value: Optional[float]) -> str:
+            return "N/A" if value is None else f"${value:.4f}"
 
-        async for document in collection.find().sort("_id", -1).limit(days):
-            entry = {
-                "date": document["_id"],
-                "opening": document["opening"],
-                "closing": document["closing"],
-                "high": document["high"],
-                "low": document["low"],
-                "volume": document["volume"],
-            }
+        def _percent(value: Optional[float]) -> str:
+            return "N/A" if value is None else f"{value:+.2f}%"
 
-            entries.append(entry)
+        embed = discord.Embed(colour=self.bot.embed_color)
+        embed.title = "Nerva Price Statistics"
 
-        pages = HistoricalPricePaginatorSource(entries=entries, ctx=ctx)
-        paginator = ViewMenuPages(
-            source=pages,
-            timeout=300,
-            delete_message_after=False,
-            clear_reactions_after=True,
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        embed.add_field(name="Last Close", value=_price(history.closes[-1]))
+        embed.add_field(
+            name="Moving Averages",
+            value=f"SMA 7: {_price(history.sma(7))}\n"
+            f"SMA 30: {_price(history.sma(30))}\n"
+            f"SMA 200: {_price(history.sma(200))}\n"
+            f"EMA 12: {_price(history.ema(12))}\n"
+            f"EMA 26: {_price(history.ema(26))}",
+        )
+        embed.add_field(
+            name="Returns",
+            value=f"1d: {_percent(history.period_return(1))}\n"
+            f"7d: {_percent(history.period_return(7))}\n"
+            f"30d: {_percent(history.period_return(30))}\n"
+            f"1y: {_percent(history.period_return(365))}",
         )
 
-        await ctx.edit_original_response(content="\U0001f44c")
-        await paginator.start(ctx)
+        volatility = history.volatility(30)
+        embed.add_field(
+            name="Volatility (30d, annualized)",
+            value="N/A" if volatility is None else f"{volatility:.2f}%",
+        )
+
+        if drawdown := history.max_drawdown():
+            percent, peak, trough = drawdown
+            embed.add_field(
+                name="Max Drawdown",
+                value=f"-{percent:.2f}% ({peak.strftime('%Y-%m-%d')} to "
+                f"{trough.strftime('%Y-%m-%d')})",
+            )
+
+        embed.set_footer(
+            text=f"Based on {len(history)} daily closes up to "
+            f"{history.dates[-1].strftime('%Y-%m-%d')}"
+        )
+
+        await ctx.edit_original_response(embed=embed)
 
 
 async def setup(bot: RoboNerva) -> None:
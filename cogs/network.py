@@ -1,32 +1,259 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
-import aiohttp
+import re
+import asyncio
+import ipaddress
+from datetime import UTC, datetime, timedelta
+
+from pymongo import UpdateOne
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import tasks, commands
 from discord.ext.menus.views import ViewMenuPages
 
 from utils.cd import cooldown
+from utils.cache import LRUCache
+from utils.ipset import IPRangeSet, format_network, parse_networks
+from utils.nodes import NodeError, NodeResult, SeedProber
 from utils.tools import (
+    is_hash,
     is_admin,
-    calculate_hashrate,
+    format_hashrate,
+    format_node_results,
     calculate_database_size,
     calculate_seconds_from_time_string,
 )
+from utils.network import BlockWindow, NetworkSnapshot
 from utils.paginators import IPBanPaginatorSource
 
 if TYPE_CHECKING:
     from bot import RoboNerva
 
-from config import COMMUNITY_GUILD_ID
+from config import (
+    BLOCK_CACHE_SIZE,
+    BLOCK_STATS_WINDOW,
+    COMMUNITY_GUILD_ID,
+    BAN_BULK_BATCH_SIZE,
+    SEED_PROBE_INTERVAL,
+    NETWORK_POLL_INTERVAL,
+    BAN_RECONCILE_INTERVAL,
+    BLOCK_HEADERS_BATCH_SIZE,
+    BAN_RECONCILE_CONCURRENCY,
+    BLOCK_CACHE_CONFIRMATIONS,
+)
 
 
 class Network(commands.Cog):
     def __init__(self, bot: RoboNerva):
         self.bot: RoboNerva = bot
+        self.snapshot: Optional[NetworkSnapshot] = None
+        self._blocks: LRUCache[str, dict] = LRUCache(BLOCK_CACHE_SIZE)
+        self._transactions: LRUCache[str, dict] = LRUCache(BLOCK_CACHE_SIZE)
+        self.block_window: BlockWindow = BlockWindow(BLOCK_STATS_WINDOW)
+        self._block_window_lock: asyncio.Lock = asyncio.Lock()
+        self.seed_prober: SeedProber = SeedProber(
+            session=bot.session, rpc_port=bot.config.SEED_NODE_RPC_PORT
+        )
+
+    def hashrate(self, snapshot: NetworkSnapshot) -> float:
+        """Windowed hashrate, falling back to an estimate from the difficulty."""
+        return self.block_window.hashrate or snapshot.difficulty / 60
+
+    def _changes(self, metric: str, value: float) -> str:
+        if (history := self.bot.get_cog("History")) is None:
+            return ""
+
+        return history.format_changes(metric, value)
+
+    async def _fetch(self, path: str, **kwargs) -> Any:
+        if self.bot.config.API_NODE_HEDGING:
+            return await self.bot.nodes.hedged_fetch(
+                self.bot.session, path, **kwargs
+            )
+
+        return await self.bot.nodes.fetch(self.bot.session, path, **kwargs)
+
+    @tasks.loop(seconds=NETWORK_POLL_INTERVAL)
+    async def _poll_network(self) -> None:
+        previous = self.snapshot
+
+        try:
+            info = (await self._fetch("/daemon/get_info/"))["result"]
+
+            if (
+                previous
+                and previous.last_block_header["hash"] == info["top_block_hash"]
+            ):
+                header, supply = previous.last_block_header, previous.supply
+
+            else:
+                # The supply only changes with a new block, so fetch it alongside.
+                header, supply = await asyncio.gather(
+                    self._fetch("/daemon/get_last_block_header/"),
+                    self._fetch("/daemon/get_generated_coins/"),
+                )
+                header = header["result"]["block_header"]
+
+            self.snapshot = NetworkSnapshot.from_daemon(info, header, supply)
+
+        except Exception as e:
+            self.bot.log.exception("Failed to poll network.", exc_info=e)
+            return
+
+        self.bot.dispatch("network_snapshot", previous, self.snapshot)
+
+    async def _fetch_block_headers(
+        self, start: int, end: int
+    ) -> list[dict[str, Any]]:
+        batches = await asyncio.gather(
+            *(
+                self._fetch(
+                    "/daemon/get_block_headers_range/",
+                    params={
+                        "start_height": batch_start,
+                        "end_height": min(
+                            batch_start + BLOCK_HEADERS_BATCH_SIZE - 1, end
+                        ),
+                    },
+                )
+                for batch_start in range(start, end + 1, BLOCK_HEADERS_BATCH_SIZE)
+            )
+        )
+
+        return [header for batch in batches for header in batch["result"]["headers"]]
+
+    async def _update_block_window(self, top_height: int) -> None:
+        tip_height = self.block_window.tip_height
+
+        start = max(top_height - self.block_window.size + 1, 0)
+
+        # Refetch the tip as well, so a reorg at the same height replaces it.
+        if tip_height is not None:
+            start = max(start, min(tip_height, top_height))
+
+        self.block_window.extend(await self._fetch_block_headers(start, top_height))
+
+        # A reorg or gap drops the window, so refill it across the full range.
+        if len(self.block_window) < min(self.block_window.size, top_height + 1):
+            self.block_window.clear()
+            self.block_window.extend(
+                await self._fetch_block_headers(
+                    max(top_height - self.block_window.size + 1, 0), top_height
+                )
+            )
+
+    @commands.Cog.listener()
+    async def on_network_snapshot(
+        self, previous: Optional[NetworkSnapshot], snapshot: NetworkSnapshot
+    ) -> None:
+        if previous is not None and previous.height == snapshot.height:
+            return
+
+        async with self._block_window_lock:
+            try:
+                await self._update_block_window(snapshot.last_block_header["height"])
+
+            except Exception as e:
+                self.bot.log.exception("Failed to update block window.", exc_info=e)
+
+    @_poll_network.before_loop
+    async def _before_poll_network(self) -> None:
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(minutes=SEED_PROBE_INTERVAL)
+    async def _probe_seed_nodes(self) -> None:
+        try:
+            await self.seed_prober.probe(self.bot.seed_nodes)
+
+        except Exception as e:
+            self.bot.log.exception("Failed to probe seed nodes.", exc_info=e)
+
+    @_probe_seed_nodes.before_loop
+    async def _before_probe_seed_nodes(self) -> None:
+        await self.bot.wait_until_ready()
+
+    async def _desired_bans(self) -> tuple[dict[str, int], set[str]]:
+        """Return active bans with their remaining seconds, and lifted ban IPs."""
+        now = datetime.now(UTC).timestamp()
+
+        active, lifted = dict(), set()
+
+        async for document in self.bot.db["ip_bans"].find():
+            if not document["active"]:
+                lifted.add(document["_id"])
+                continue
+
+            remaining = document["expires_at"].replace(tzinfo=UTC).timestamp() - now
+
+            if remaining > 0:
+                active[document["_id"]] = int(remaining)
+
+        return active, lifted
+
+    async def _reconcile_node(
+        self, result: NodeResult, active: dict[str, int], lifted: set[str]
+    ) -> int:
+        present = {ban["host"] for ban in result.data["result"].get("bans", [])}
+
+        paths = [
+            f"/daemon/set_bans?ip={ip}&ban=true&time={seconds}"
+            for ip, seconds in active.items()
+            if ip not in present
+        ] + [f"/daemon/set_bans?ip={ip}&ban=false&time=0" for ip in lifted & present]
+
+        semaphore = asyncio.Semaphore(BAN_RECONCILE_CONCURRENCY)
+
+        async def _apply(path: str) -> None:
+            async with semaphore:
+                await self.bot.nodes.fetch(self.bot.session, path, node=result.url)
+
+        await asyncio.gather(
+            *(_apply(path) for path in paths), return_exceptions=True
+        )
+
+        return len(paths)
+
+    @tasks.loop(minutes=BAN_RECONCILE_INTERVAL)
+    async def _reconcile_bans(self) -> None:
+        try:
+            (active, lifted), results = await asyncio.gather(
+                self._desired_bans(),
+                self.bot.nodes.fan_out(self.bot.session, "/daemon/get_bans/"),
+            )
+
+            changes = await asyncio.gather(
+                *(
+                    self._reconcile_node(result, active, lifted)
+                    for result in results
+                    if result.ok
+                )
+            )
+
+            if sum(changes):
+                self.bot.log.info(f"Reconciled {sum(changes)} IP bans across nodes.")
+
+        except Exception as e:
+            self.bot.log.exception("Failed to reconcile IP bans.", exc_info=e)
+
+    @_reconcile_bans.before_loop
+    async def _before_reconcile_bans(self) -> None:
+        await self.bot.wait_until_ready()
+
+    async def cog_load(self) -> None:
+        await self.bot.db["block_cache"].create_index("height", unique=True)
+        await self.bot.db["ip_bans"].create_index("expires_at", expireAfterSeconds=0)
+
+        self._poll_network.start()
+        self._probe_seed_nodes.start()
+        self._reconcile_bans.start()
+
+    def cog_unload(self) -> None:
+        self._poll_network.cancel()
+        self._probe_seed_nodes.cancel()
+        self._reconcile_bans.cancel()
 
     @app_commands.command(name="info")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
@@ -36,43 +263,46 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
+
+        timestamp = snapshot.last_block_header["timestamp"]
+
         embed = discord.Embed(color=self.bot.embed_color)
         embed.title = "Nerva Network Information"
 
         embed.set_author(name="Nerva", icon_url=self.bot.user.avatar.url)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.bot.api_url}/daemon/get_info/") as res:
-                data = (await res.json())["result"]
+        hashrate = self.hashrate(snapshot)
 
-                embed.add_field(name="Height", value=data["height"])
-                embed.add_field(name="Difficulty", value=data["difficulty"])
-                embed.add_field(
-                    name="Network Hashrate",
-                    value=calculate_hashrate(data["difficulty"]),
-                )
-                embed.add_field(name="", value="")
-                embed.add_field(
-                    name="Database Size",
-                    value=calculate_database_size(data["database_size"]),
-                )
-                embed.add_field(
-                    name="Top Block Hash",
-                    value=f"[`{data['top_block_hash']}`]"
-                    f"(https://explorer.nerva.one/detail/{data['top_block_hash']})",
-                    inline=False,
-                )
-
-            async with session.get(
-                f"{self.bot.api_url}/daemon/get_last_block_header/"
-            ) as res:
-                data = (await res.json())["result"]["block_header"]
+        embed.add_field(name="Height", value=snapshot.height)
+        embed.add_field(
+            name="Difficulty",
+            value=f"{snapshot.difficulty}"
+            f"{self._changes('difficulty', snapshot.difficulty)}",
+        )
+        embed.add_field(
+            name="Network Hashrate",
+            value=f"{format_hashrate(hashrate)}{self._changes('hashrate', hashrate)}",
+        )
+        embed.add_field(
+            name="Last Block Timestamp",
+            value=f"<t:{timestamp}:F> (<t:{timestamp}:R>)",
+        )
+        embed.add_field(
+            name="Database Size",
+            value=calculate_database_size(snapshot.database_size),
+        )
+        embed.add_field(
+            name="Top Block Hash",
+            value=f"[`{snapshot.top_block_hash}`]"
+            f"(https://explorer.nerva.one/detail/{snapshot.top_block_hash})",
+            inline=False,
+        )
 
-                embed.set_field_at(
-                    3,
-                    name="Last Block Timestamp",
-                    value=f"<t:{data['timestamp']}:F> (<t:{data['timestamp']}:R>)",
-                )
+        embed.set_footer(text=f"Updated {int(snapshot.age)}s ago")
 
         await ctx.edit_original_response(embed=embed)
 
@@ -84,14 +314,14 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.bot.api_url}/daemon/get_info/") as res:
-                data = (await res.json())["result"]
-
-                height = data["height"]
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
 
         await ctx.edit_original_response(
-            content=f"The current block height is `{height}`."
+            content=f"The current block height is `{snapshot.height}` "
+            f"(updated {int(snapshot.age)}s ago)."
         )
 
     @app_commands.command(name="difficulty")
@@ -102,14 +332,14 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.bot.api_url}/daemon/get_info/") as res:
-                data = (await res.json())["result"]
-
-                difficulty = data["difficulty"]
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
 
         await ctx.edit_original_response(
-            content=f"The current network difficulty is `{difficulty}`."
+            content=f"The current network difficulty is `{snapshot.difficulty}` "
+            f"(updated {int(snapshot.age)}s ago)."
         )
 
     @app_commands.command(name="hashrate")
@@ -120,16 +350,52 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.bot.api_url}/daemon/get_info/") as res:
-                data = (await res.json())["result"]
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
 
-                hashrate = calculate_hashrate(data["difficulty"])
+        hashrate = format_hashrate(self.hashrate(snapshot))
 
         await ctx.edit_original_response(
-            content=f"The current network hashrate is `{hashrate}`."
+            content=f"The current network hashrate is `{hashrate}` "
+            f"(updated {int(snapshot.age)}s ago)."
+        )
+
+    @app_commands.command(name="blocktime")
+    @app_commands.guilds(COMMUNITY_GUILD_ID)
+    @app_commands.checks.dynamic_cooldown(cooldown)
+    async def _blocktime(self, ctx: discord.Interaction):
+        """Shows the average block time and recent network trends."""
+        # noinspection PyUnresolvedReferences
+        await ctx.response.defer(thinking=True)
+
+        window = self.block_window
+
+        if window.block_time is None:
+            return await ctx.edit_original_response(
+                content="Block statistics are not available yet."
+            )
+
+        embed = discord.Embed(color=self.bot.embed_color)
+        embed.title = "Nerva Block Statistics"
+
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        embed.add_field(name="Average Block Time", value=f"{window.block_time:.2f}s")
+
+        if (hashrate := window.hashrate) is not None:
+            embed.add_field(name="Network Hashrate", value=format_hashrate(hashrate))
+
+        if (trend := window.difficulty_trend) is not None:
+            embed.add_field(name="Difficulty Trend", value=f"{trend:+.2f}%")
+
+        embed.set_footer(
+            text=f"Over the last {len(window)} blocks (up to {window.tip_height})"
         )
 
+        await ctx.edit_original_response(embed=embed)
+
     @app_commands.command(name="supply")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
@@ -138,14 +404,14 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.bot.api_url}/daemon/get_generated_coins/"
-            ) as res:
-                supply = await res.json()
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
 
         await ctx.edit_original_response(
-            content=f"The current circulating supply is `{supply} XNV`."
+            content=f"The current circulating supply is `{snapshot.supply} XNV` "
+            f"(updated {int(snapshot.age)}s ago)."
         )
 
     @app_commands.command(name="seeds")
@@ -167,8 +433,27 @@ class Network(commands.Cog):
 
         embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
 
-        for i, node in enumerate(self.bot.seed_nodes, start=1):
-            embed.description += f"`{i}`. {node}\n"
+        probed = {
+            seed.address: seed for seed in self.seed_prober.ranked() if seed.history
+        }
+
+        # Healthiest seeds first, followed by any not probed yet.
+        nodes = list(probed) + [
+            node for node in self.bot.seed_nodes if node not in probed
+        ]
+
+        for i, node in enumerate(nodes, start=1):
+            embed.description += f"`{i}`. {node}"
+
+            if (seed := probed.get(node)) is not None:
+                status = (
+                    f"\U0001f7e2 {int(seed.latency * 1000)} ms"
+                    if seed.up
+                    else "\U0001f534 down"
+                )
+                embed.description += f" — {status}, {seed.uptime:.0%} uptime"
+
+            embed.description += "\n"
 
         await ctx.edit_original_response(embed=embed)
 
@@ -180,35 +465,38 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
+
         embed = discord.Embed(color=self.bot.embed_color)
         embed.title = "Seed Node Information"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.bot.api_url}/daemon/get_info/") as res:
-                data = (await res.json())["result"]
+        embed.add_field(name="Version", value=snapshot.version)
+        embed.add_field(
+            name="Height", value=f"{snapshot.height}/{snapshot.target_height}"
+        )
+        embed.add_field(
+            name="Incoming Connections",
+            value=snapshot.incoming_connections_count,
+        )
+        embed.add_field(
+            name="Outgoing Connections",
+            value=snapshot.outgoing_connections_count,
+        )
+        embed.add_field(
+            name="Network Hashrate",
+            value=format_hashrate(self.hashrate(snapshot)),
+        )
+        embed.add_field(
+            name="Top Block Hash",
+            value=f"[`{snapshot.top_block_hash}`]"
+            f"(https://explorer.nerva.one/detail/{snapshot.top_block_hash})",
+            inline=False,
+        )
 
-                embed.add_field(name="Version", value=data["version"])
-                embed.add_field(
-                    name="Height", value=f"{data['height']}/{data['target_height']}"
-                )
-                embed.add_field(
-                    name="Incoming Connections",
-                    value=data["incoming_connections_count"],
-                )
-                embed.add_field(
-                    name="Outgoing Connections",
-                    value=data["outgoing_connections_count"],
-                )
-                embed.add_field(
-                    name="Network Hashrate",
-                    value=calculate_hashrate(data["difficulty"]),
-                )
-                embed.add_field(
-                    name="Top Block Hash",
-                    value=f"[`{data['top_block_hash']}`]"
-                    f"(https://explorer.nerva.one/detail/{data['top_block_hash']})",
-                    inline=False,
-                )
+        embed.set_footer(text=f"Updated {int(snapshot.age)}s ago")
 
         await ctx.edit_original_response(embed=embed)
 
@@ -220,41 +508,249 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
+
+        data = snapshot.last_block_header
+
         embed = discord.Embed(color=self.bot.embed_color)
 
         embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.bot.api_url}/daemon/get_last_block_header/"
-            ) as res:
-                data = (await res.json())["result"]["block_header"]
+        embed.title = f"Block {data['height']}"
 
-                embed.title = f"Block {data['height']}"
+        embed.add_field(name="Difficulty", value=data["difficulty"])
+        embed.add_field(name="Size", value=f"{data['block_size']} bytes")
+        embed.add_field(name="Nonce", value=data["nonce"])
+        embed.add_field(name="Number of Transactions", value=data["num_txes"])
+        embed.add_field(
+            name="Timestamp",
+            value=f"<t:{data['timestamp']}:F> (<t:{data['timestamp']}:R>)",
+        )
+        embed.add_field(
+            name="Hash",
+            value=f"[`{data['hash']}`]"
+            f"(https://explorer.nerva.one/detail/{data['hash']})",
+            inline=False,
+        )
+        embed.add_field(
+            name="Miner Transaction Hash",
+            value=f"[`{data['miner_tx_hash']}`]"
+            f"(https://explorer.nerva.one/detail/{data['miner_tx_hash']})",
+            inline=False,
+        )
 
-                embed.add_field(name="Difficulty", value=data["difficulty"])
-                embed.add_field(name="Size", value=f"{data['block_size']} bytes")
-                embed.add_field(name="Nonce", value=data["nonce"])
-                embed.add_field(
-                    name="Number of Transactions", value=data["num_txes"]
-                )
-                embed.add_field(
-                    name="Timestamp",
-                    value=f"<t:{data['timestamp']}:F> (<t:{data['timestamp']}:R>)",
-                )
-                embed.add_field(
-                    name="Hash",
-                    value=f"[`{data['hash']}`]"
-                    f"(https://explorer.nerva.one/detail/{data['hash']})",
-                    inline=False,
+        embed.set_footer(text=f"Updated {int(snapshot.age)}s ago")
+
+        await ctx.edit_original_response(embed=embed)
+
+    async def _get_block(self, block_id: str) -> Optional[dict[str, Any]]:
+        if (block := self._blocks.get(block_id)) is not None:
+            return block
+
+        collection = self.bot.db["block_cache"]
+
+        if block_id.isdigit():
+            block = await collection.find_one({"height": int(block_id)})
+            params = {"height": int(block_id)}
+
+        else:
+            block = await collection.find_one({"_id": block_id})
+            params = {"hash": block_id}
+
+        if block is None:
+            # A height above the tip cannot exist, so do not ask a node for it.
+            if (
+                block_id.isdigit()
+                and self.snapshot is not None
+                and int(block_id) > self.snapshot.height
+            ):
+                return None
+
+            try:
+                response = await self._fetch("/daemon/get_block/", params=params)
+
+            # Nodes answer an unknown hash with a JSON-RPC error.
+            except NodeError:
+                return None
+
+            if not (data := response.get("result")) or "block_header" not in data:
+                return None
+
+            header = data["block_header"]
+
+            block = {
+                "_id": header["hash"],
+                "height": header["height"],
+                "header": header,
+                "tx_hashes": data.get("tx_hashes", []),
+            }
+
+            # Only blocks buried deep enough are immutable; the tip may still be
+            # reorganised away, so it is always refetched.
+            if not self._is_confirmed(header["height"]):
+                return block
+
+            await collection.replace_one({"_id": block["_id"]}, block, upsert=True)
+
+        self._blocks.set(block["_id"], block)
+        self._blocks.set(str(block["height"]), block)
+
+        return block
+
+    async def _get_transaction(self, tx_hash: str) -> Optional[dict[str, Any]]:
+        if (tx := self._transactions.get(tx_hash)) is not None:
+            return tx
+
+        collection = self.bot.db["transaction_cache"]
+
+        if (tx := await collection.find_one({"_id": tx_hash})) is None:
+            txs = (
+                await self._fetch(
+                    "/daemon/get_transactions/", params={"txs_hashes": tx_hash}
                 )
+            )["result"].get("txs")
+
+            if not txs:
+                return None
+
+            tx = {"_id": tx_hash, **txs[0]}
+
+            if tx.get("in_pool") or not self._is_confirmed(tx["block_height"]):
+                return tx
+
+            await collection.replace_one({"_id": tx_hash}, tx, upsert=True)
+
+        self._transactions.set(tx_hash, tx)
+
+        return tx
+
+    def _is_confirmed(self, height: int) -> bool:
+        if self.snapshot is None:
+            return False
+
+        return self.snapshot.height - height >= BLOCK_CACHE_CONFIRMATIONS
+
+    @app_commands.command(name="block")
+    @app_commands.guilds(COMMUNITY_GUILD_ID)
+    @app_commands.checks.dynamic_cooldown(cooldown)
+    async def _block(self, ctx: discord.Interaction, block: str):
+        """Shows information about a block.
+
+        Parameters
+        ----------
+        block : str
+            The height or hash of the block.
+
+        """
+        block = block.strip().lower()
+
+        if not (block.isdigit() or is_hash(block)):
+            # noinspection PyUnresolvedReferences
+            return await ctx.response.send_message(
+                content="Please provide a valid block height or hash.",
+                ephemeral=True,
+            )
+
+        # noinspection PyUnresolvedReferences
+        await ctx.response.defer(thinking=True)
+
+        if (data := await self._get_block(block)) is None:
+            return await ctx.edit_original_response(
+                content="Sorry, no such block found."
+            )
+
+        data = data["header"]
+
+        embed = discord.Embed(color=self.bot.embed_color)
+
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        embed.title = f"Block {data['height']}"
+
+        embed.add_field(name="Difficulty", value=data["difficulty"])
+        embed.add_field(name="Size", value=f"{data['block_size']} bytes")
+        embed.add_field(name="Reward", value=f"{data['reward'] / 1e12} XNV")
+        embed.add_field(name="Number of Transactions", value=data["num_txes"])
+        embed.add_field(
+            name="Timestamp",
+            value=f"<t:{data['timestamp']}:F> (<t:{data['timestamp']}:R>)",
+        )
+        embed.add_field(
+            name="Hash",
+            value=f"[`{data['hash']}`]"
+            f"(https://explorer.nerva.one/detail/{data['hash']})",
+            inline=False,
+        )
+        embed.add_field(
+            name="Previous Block Hash",
+            value=f"[`{data['prev_hash']}`]"
+            f"(https://explorer.nerva.one/detail/{data['prev_hash']})",
+            inline=False,
+        )
+
+        await ctx.edit_original_response(embed=embed)
+
+    @app_commands.command(name="tx")
+    @app_commands.guilds(COMMUNITY_GUILD_ID)
+    @app_commands.checks.dynamic_cooldown(cooldown)
+    async def _tx(self, ctx: discord.Interaction, tx_hash: str):
+        """Shows information about a transaction.
+
+        Parameters
+        ----------
+        tx_hash : str
+            The hash of the transaction.
+
+        """
+        tx_hash = tx_hash.strip().lower()
+
+        if not is_hash(tx_hash):
+            # noinspection PyUnresolvedReferences
+            return await ctx.response.send_message(
+                content="Please provide a valid transaction hash.",
+                ephemeral=True,
+            )
+
+        # noinspection PyUnresolvedReferences
+        await ctx.response.defer(thinking=True)
+
+        if (data := await self._get_transaction(tx_hash)) is None:
+            return await ctx.edit_original_response(
+                content="Sorry, no such transaction found."
+            )
+
+        embed = discord.Embed(color=self.bot.embed_color)
+        embed.title = "Transaction Information"
+
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        if data.get("in_pool"):
+            embed.add_field(name="Status", value="In mempool")
+
+        else:
+            embed.add_field(name="Block Height", value=data["block_height"])
+
+            if self.snapshot is not None:
                 embed.add_field(
-                    name="Miner Transaction Hash",
-                    value=f"[`{data['miner_tx_hash']}`]"
-                    f"(https://explorer.nerva.one/detail/{data['miner_tx_hash']})",
-                    inline=False,
+                    name="Confirmations",
+                    value=self.snapshot.height - data["block_height"],
                 )
 
+            embed.add_field(
+                name="Timestamp",
+                value=f"<t:{data['block_timestamp']}:F> "
+                f"(<t:{data['block_timestamp']}:R>)",
+            )
+
+        embed.add_field(
+            name="Hash",
+            value=f"[`{tx_hash}`](https://explorer.nerva.one/detail/{tx_hash})",
+            inline=False,
+        )
+
         await ctx.edit_original_response(embed=embed)
 
     @app_commands.command(name="inflation")
@@ -265,55 +761,107 @@ class Network(commands.Cog):
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        new_xnv_per_year = 157788
-        new_xnv_per_month = 13149
-        new_xnv_per_week = 3024
-        new_xnv_per_day = 432
+        if (snapshot := self.snapshot) is None:
+            return await ctx.edit_original_response(
+                content="Network information is not available yet."
+            )
+
+        history = self.bot.get_cog("History")
+        year = timedelta(days=365)
 
         embed = discord.Embed(color=self.bot.embed_color)
         embed.title = "Nerva Inflation Information"
         embed.description = (
             "<:nerva:1274417479606603776> is already in tail emission which means that each block has "
-            "0.3 XNV (+ transaction fee) miner reward. **Below numbers are estimates.**"
+            "0.3 XNV (+ transaction fee) miner reward. Below numbers are measured from "
+            "the observed supply."
         )
 
         embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.bot.api_url}/daemon/get_generated_coins/"
-            ) as res:
-                coins = await res.json()
+        embed.add_field(
+            name="Circulating Supply",
+            value=f"{snapshot.supply:,.0f} XNV",
+            inline=False,
+        )
 
+        for window in ("day", "month", "year"):
+            if (
+                history is None
+                or (emission := history.emission(window, snapshot.supply)) is None
+            ):
                 embed.add_field(
-                    name="Current Annual Inflation Percentage",
-                    value=f"{(new_xnv_per_year / coins) * 100:.3f}%",
-                    inline=False,
+                    name=f"Last {window}", value="Not enough history yet."
                 )
+                continue
 
-                embed.add_field(name="New XNV per year", value=new_xnv_per_year)
-                embed.add_field(name="New XNV per month", value=new_xnv_per_month)
-                embed.add_field(name="New XNV per week", value=new_xnv_per_week)
-                embed.add_field(name="New XNV per day", value=new_xnv_per_day)
+            emitted, elapsed = emission
+            annual_rate = (
+                emitted / (snapshot.supply - emitted) * (year / elapsed) * 100
+            )
+
+            embed.add_field(
+                name=f"Last {window}",
+                value=f"{emitted:,.2f} XNV emitted\n"
+                f"{annual_rate:.3f}% annualized"
+                + (
+                    f"\n(over {elapsed.days}d {elapsed.seconds // 3600}h)"
+                    if elapsed < history.EMISSION_WINDOWS[window][0] * 0.95
+                    else ""
+                ),
+            )
+
+        embed.set_footer(text=f"Updated {int(snapshot.age)}s ago")
 
         await ctx.edit_original_response(embed=embed)
 
     @app_commands.command(name="bans")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
-    async def _bans(self, ctx: discord.Interaction):
-        """Shows the list of banned IP addresses."""
+    async def _bans(
+        self,
+        ctx: discord.Interaction,
+        ip_prefix: Optional[str] = None,
+        reason: Optional[str] = None,
+        sort: Literal["expiring", "longest"] = "expiring",
+    ):
+        """Shows the list of banned IP addresses.
+
+        Parameters
+        ----------
+        ip_prefix : str
+            Only show bans whose IP address or range starts with this prefix.
+        reason : str
+            Only show bans whose reason contains this text.
+        sort : str
+            Show the bans expiring soonest or lasting longest first.
+
+        """
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.bot.api_url}/daemon/get_bans/") as res:
-                bans = (await res.json())["result"]
+        collection = self.bot.db["ip_bans"]
+        query: dict[str, Any] = {
+            "active": True,
+            "expires_at": {"$gt": datetime.now(UTC)},
+        }
+
+        if ip_prefix:
+            query["_id"] = {"$regex": f"^{re.escape(ip_prefix)}"}
 
-        if "bans" not in bans.keys():
+        if reason:
+            query["reason"] = {"$regex": re.escape(reason), "$options": "i"}
+
+        if not (total := await collection.count_documents(query)):
             return await ctx.edit_original_response(content="There are no IP bans.")
 
-        pages = IPBanPaginatorSource(entries=bans, ctx=ctx)
+        pages = IPBanPaginatorSource(
+            collection=collection,
+            ctx=ctx,
+            query=query,
+            sort=[("expires_at", 1 if sort == "expiring" else -1)],
+            total=total,
+        )
         paginator = ViewMenuPages(
             source=pages,
             timeout=300,
@@ -327,7 +875,13 @@ class Network(commands.Cog):
     @app_commands.command(name="ban")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
-    async def _ban(self, ctx: discord.Interaction, ip: str, time: str):
+    async def _ban(
+        self,
+        ctx: discord.Interaction,
+        ip: str,
+        time: str,
+        reason: str = "No reason provided",
+    ):
         """(ADMIN) Bans an IP address.
 
         Parameters
@@ -336,6 +890,8 @@ class Network(commands.Cog):
             The IP address to ban.
         time : str
             The time to ban the IP address for. (eg: 1w, 3d 12h, 5m etc.)
+        reason : str
+            The reason for the ban.
 
         """
         if not is_admin(ctx.user):
@@ -345,77 +901,254 @@ class Network(commands.Cog):
                 ephemeral=True,
             )
 
+        # Store the canonical form, so e.g. IPv6 spellings share one registry entry.
+        try:
+            ip = str(ipaddress.ip_address(ip.strip()))
+
+        except ValueError:
+            # noinspection PyUnresolvedReferences
+            return await ctx.response.send_message(
+                content="Please provide a valid IP address.",
+                ephemeral=True,
+            )
+
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        node_count = len(self.bot.api_nodes)
-        pass_count = 0
+        seconds = calculate_seconds_from_time_string(time)
+        now = datetime.now(UTC)
+
+        await self.bot.db["ip_bans"].update_one(
+            {"_id": ip},
+            {
+                "$set": {
+                    "active": True,
+                    "expires_at": now + timedelta(seconds=seconds),
+                    "reason": reason,
+                    "author_id": ctx.user.id,
+                    "created_at": now,
+                }
+            },
+            upsert=True,
+        )
 
-        async with aiohttp.ClientSession() as session:
-            for node in self.bot.api_nodes:
-                async with session.get(
-                    f"{node}/daemon/set_bans?ip={ip}&ban=true&"
-                    f"time={calculate_seconds_from_time_string(time)}"
-                ) as res:
-                    data = (await res.json())["result"]
+        results = await self.bot.nodes.fan_out(
+            self.bot.session, f"/daemon/set_bans?ip={ip}&ban=true&time={seconds}"
+        )
 
-                    if data["status"] == "OK":
-                        pass_count += 1
+        pass_count = sum(result.ok for result in results)
+        report = format_node_results(results)
 
         if pass_count == 0:
             return await ctx.edit_original_response(
-                content="Failed to ban IP from all seed nodes."
+                content=f"Failed to ban IP from all seed nodes.\n{report}"
+            )
+
+        elif pass_count < len(results):
+            return await ctx.edit_original_response(
+                content=f"Partially banned IP from seed nodes, the remaining nodes "
+                f"will be reconciled shortly.\n{report}"
+            )
+
+        await ctx.edit_original_response(
+            content=f"Successfully banned IP from all seed nodes.\n{report}"
+        )
+
+    @app_commands.command(name="banbulk")
+    @app_commands.guilds(COMMUNITY_GUILD_ID)
+    @app_commands.checks.dynamic_cooldown(cooldown)
+    async def _ban_bulk(
+        self,
+        ctx: discord.Interaction,
+        time: str,
+        entries: Optional[str] = None,
+        file: Optional[discord.Attachment] = None,
+        reason: str = "No reason provided",
+    ):
+        """(ADMIN) Bans a list of IP addresses and CIDR ranges.
+
+        Parameters
+        ----------
+        time : str
+            The time to ban the addresses for. (eg: 1w, 3d 12h, 5m etc.)
+        entries : str
+            IP addresses and CIDR ranges separated by spaces or commas.
+        file : discord.Attachment
+            A text file with IP addresses and CIDR ranges.
+        reason : str
+            The reason for the bans.
+
+        """
+        if not is_admin(ctx.user):
+            # noinspection PyUnresolvedReferences
+            return await ctx.response.send_message(
+                content="Only admins can use this command.",
+                ephemeral=True,
+            )
+
+        if entries is None and file is None:
+            # noinspection PyUnresolvedReferences
+            return await ctx.response.send_message(
+                content="Please provide a list of IPs or upload a file.",
+                ephemeral=True,
             )
 
-        elif pass_count < node_count:
+        # noinspection PyUnresolvedReferences
+        await ctx.response.defer(thinking=True)
+
+        text = entries or ""
+
+        if file is not None:
+            text += "\n" + (await file.read()).decode("utf-8", errors="ignore")
+
+        networks, invalid = parse_networks(text)
+        ranges = [
+            format_network(network) for network in IPRangeSet(networks).networks()
+        ]
+
+        if not ranges:
             return await ctx.edit_original_response(
-                content="Partially banned IP from seed nodes."
+                content="No valid IP addresses or CIDR ranges were provided."
+            )
+
+        seconds = calculate_seconds_from_time_string(time)
+        now = datetime.now(UTC)
+
+        await self.bot.db["ip_bans"].bulk_write(
+            [
+                UpdateOne(
+                    {"_id": host},
+                    {
+                        "$set": {
+                            "active": True,
+                            "expires_at": now + timedelta(seconds=seconds),
+                            "reason": reason,
+                            "author_id": ctx.user.id,
+                            "created_at": now,
+                        }
+                    },
+                    upsert=True,
+                )
+                for host in ranges
+            ],
+            ordered=False,
+        )
+
+        summary = (
+            f"Merged {len(networks)} entries into {len(ranges)} ranges"
+            + (f", skipped {len(invalid)} invalid entries" if invalid else "")
+            + "."
+        )
+
+        applied, partial, failed = 0, 0, 0
+
+        for i in range(0, len(ranges), BAN_BULK_BATCH_SIZE):
+            batch = await asyncio.gather(
+                *(
+                    self.bot.nodes.fan_out(
+                        self.bot.session,
+                        f"/daemon/set_bans?ip={host}&ban=true&time={seconds}",
+                    )
+                    for host in ranges[i : i + BAN_BULK_BATCH_SIZE]
+                )
+            )
+
+            for results in batch:
+                pass_count = sum(result.ok for result in results)
+
+                if pass_count == len(results):
+                    applied += 1
+
+                elif pass_count:
+                    partial += 1
+
+                else:
+                    failed += 1
+
+            await ctx.edit_original_response(
+                content=f"{summary}\nBanning... {applied + partial + failed}"
+                f"/{len(ranges)}"
             )
 
         await ctx.edit_original_response(
-            content="Successfully banned IP from all seed nodes."
+            content=f"{summary}\n"
+            f"```css\n"
+            f"Banned on all nodes: {applied}\n"
+            f"Partially banned: {partial}\n"
+            f"Failed: {failed}\n"
+            f"```"
+            + (
+                "\nRanges missing from some nodes will be reconciled shortly."
+                if partial or failed
+                else ""
+            )
         )
 
     @app_commands.command(name="unban")
     @app_commands.guilds(COMMUNITY_GUILD_ID)
     @app_commands.checks.dynamic_cooldown(cooldown)
     async def _unban(self, ctx: discord.Interaction, ip: str):
-        """Unbans an IP address.
+        """(ADMIN) Unbans an IP address or CIDR range.
 
         Parameters
         ----------
         ip : str
-            The IP address to unban.
+            The IP address or CIDR range to unban.
 
         """
+        if not is_admin(ctx.user):
+            # noinspection PyUnresolvedReferences
+            return await ctx.response.send_message(
+                content="Only admins can use this command.",
+                ephemeral=True,
+            )
+
+        # Ranges from /banbulk are stored in the same form, so they can be lifted.
+        try:
+            ip = format_network(ipaddress.ip_network(ip.strip(), strict=False))
+
+        except ValueError:
+            # noinspection PyUnresolvedReferences
+            return await ctx.response.send_message(
+                content="Please provide a valid IP address or CIDR range.",
+                ephemeral=True,
+            )
+
         # noinspection PyUnresolvedReferences
         await ctx.response.defer(thinking=True)
 
-        node_count = len(self.bot.api_nodes)
-        pass_count = 0
+        # Keep a tombstone so the reconciler lifts the ban from nodes that missed
+        # this request, until it expires.
+        await self.bot.db["ip_bans"].update_one(
+            {"_id": ip},
+            {
+                "$set": {
+                    "active": False,
+                    "expires_at": datetime.now(UTC) + timedelta(days=7),
+                }
+            },
+        )
 
-        async with aiohttp.ClientSession() as session:
-            for node in self.bot.api_nodes:
-                async with session.get(
-                    f"{node}/daemon/set_bans?ip={ip}&ban=false&time=0"
-                ) as res:
-                    data = (await res.json())["result"]
+        results = await self.bot.nodes.fan_out(
+            self.bot.session, f"/daemon/set_bans?ip={ip}&ban=false&time=0"
+        )
 
-                    if data["status"] == "OK":
-                        pass_count += 1
+        pass_count = sum(result.ok for result in results)
+        report = format_node_results(results)
 
         if pass_count == 0:
             return await ctx.edit_original_response(
-                content="Failed to unban IP from all seed nodes."
+                content=f"Failed to unban IP from all seed nodes.\n{report}"
             )
 
-        elif pass_count < node_count:
+        elif pass_count < len(results):
             return await ctx.edit_original_response(
-                content="Partially unbanned IP from seed nodes."
+                content=f"Partially unbanned IP from seed nodes, the remaining nodes "
+                f"will be reconciled shortly.\n{report}"
             )
 
         await ctx.edit_original_response(
-            content="Successfully unbanned IP from all seed nodes."
+            content=f"Successfully unbanned IP from all seed nodes.\n{report}"
         )
 
 
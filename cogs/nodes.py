@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+import discord
+from discord import app_commands
+from discord.ext import tasks, commands
+
+from utils.cd import cooldown
+from utils.nodes import NodeStatus, classify_nodes
+
+if TYPE_CHECKING:
+    from bot import RoboNerva
+
+from config import COMMUNITY_GUILD_ID, NODE_MONITOR_INTERVAL
+
+
+class NodeMonitor(commands.Cog):
+    def __init__(self, bot: RoboNerva):
+        self.bot: RoboNerva = bot
+        self.statuses: list[NodeStatus] = list()
+        # Last issue reported for each node, so an alert is only sent on change.
+        self._alerted: dict[str, str] = dict()
+
+    def cog_load(self) -> None:
+        self._monitor_nodes.start()
+
+    def cog_unload(self) -> None:
+        self._monitor_nodes.cancel()
+
+    async def _alert(self, status: NodeStatus) -> None:
+        previous = self._alerted.get(status.url)
+
+        if status.issue == previous:
+            return
+
+        if status.issue is None:
+            del self._alerted[status.url]
+            message = f"API node `{status.url}` has recovered from being {previous}."
+
+        else:
+            self._alerted[status.url] = status.issue
+            message = (
+                f"API node `{status.url}` is {status.issue} "
+                f"(height: {status.height or 'N/A'}, "
+                f"version: {status.version or 'N/A'})."
+            )
+
+        self.bot.log.warning(message)
+        await self.bot.log_hook.send(message)
+
+    @tasks.loop(seconds=NODE_MONITOR_INTERVAL)
+    async def _monitor_nodes(self) -> None:
+        try:
+            results = await self.bot.nodes.fan_out(
+                self.bot.session, "/daemon/get_info/"
+            )
+
+            self.statuses = classify_nodes(results)
+
+            for status in self.statuses:
+                self.bot.nodes.set_diverged(status.url, status.diverged)
+
+            # Forget nodes that were removed from the registry.
+            urls = {status.url for status in self.statuses}
+            self._alerted = {
+                url: issue for url, issue in self._alerted.items() if url in urls
+            }
+
+            for status in self.statuses:
+                await self._alert(status)
+
+        except Exception as e:
+            self.bot.log.exception("Failed to monitor API nodes.", exc_info=e)
+
+    @_monitor_nodes.before_loop
+    async def _before_monitor_nodes(self) -> None:
+        await self.bot.wait_until_ready()
+
+    @staticmethod
+    def _format_statuses(statuses: list[NodeStatus]) -> str:
+        width = max((len(status.url) for status in statuses), default=4)
+
+        def _cell(value: Optional[object]) -> str:
+            return "N/A" if value is None else str(value)
+
+        lines = [f"{'Node':<{width}}  {'Height':<8}  {'Version':<16}  Status"]
+
+        for status in statuses:
+            lines.append(
+                f"{status.url:<{width}}  {_cell(status.height):<8}  "
+                f"{_cell(status.version):<16}  {status.issue or 'OK'} "
+                f"({int(status.latency * 1000)} ms)"
+            )
+
+        return "```\n" + "\n".join(lines) + "\n```"
+
+    @app_commands.command(name="nodes")
+    @app_commands.guilds(COMMUNITY_GUILD_ID)
+    @app_commands.checks.dynamic_cooldown(cooldown)
+    async def _nodes(self, ctx: discord.Interaction):
+        """Shows the health of every API node."""
+        # noinspection PyUnresolvedReferences
+        await ctx.response.defer(thinking=True)
+
+        if not self.statuses:
+            return await ctx.edit_original_response(
+                content="Node health is not available yet."
+            )
+
+        embed = discord.Embed(color=self.bot.embed_color)
+        embed.title = "Nerva API Nodes"
+        embed.description = self._format_statuses(self.statuses)
+
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        healthy = sum(status.issue is None for status in self.statuses)
+        embed.set_footer(text=f"{healthy}/{len(self.statuses)} nodes healthy")
+
+        await ctx.edit_original_response(embed=embed)
+
+
+async def setup(bot: RoboNerva) -> None:
+    await bot.add_cog(NodeMonitor(bot))
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from datetime import UTC, datetime
+
+import discord
+from discord.ext import tasks, commands
+
+from utils.tools import format_hashrate
+from utils.network import NetworkSnapshot
+
+if TYPE_CHECKING:
+    from bot import RoboNerva
+
+from config import STATUS_BOARD_EDIT_INTERVAL
+
+
+class StatusBoard(commands.Cog):
+    def __init__(self, bot: RoboNerva):
+        self.bot: RoboNerva = bot
+        self._message: Optional[discord.PartialMessage] = None
+        self._dirty: bool = False
+        self._price: Any = None
+
+    def cog_load(self) -> None:
+        self._update_board.start()
+
+    def cog_unload(self) -> None:
+        self._update_board.cancel()
+
+    @commands.Cog.listener()
+    async def on_market_refresh(self) -> None:
+        exchange, pair = self.bot.config.STATUS_BOARD_PRICE_PAIR
+        ticker = self.bot.get_cog("Market").aggregator.ticker(exchange, pair)
+
+        if ticker is not None and ticker.last_price != self._price:
+            self._price = ticker.last_price
+            self._dirty = True
+
+    @commands.Cog.listener()
+    async def on_network_snapshot(
+        self, previous: Optional[NetworkSnapshot], snapshot: NetworkSnapshot
+    ) -> None:
+        if previous is None or previous.top_block_hash != snapshot.top_block_hash:
+            self._dirty = True
+
+    async def _get_message(self) -> Optional[discord.PartialMessage]:
+        if self._message is not None:
+            return self._message
+
+        channel = self.bot.get_channel(self.bot.config.STATUS_BOARD_CHANNEL_ID)
+
+        if not channel:
+            return None
+
+        collection = self.bot.db.get_collection("status_board")
+
+        if data := await collection.find_one({"_id": channel.id}):
+            self._message = channel.get_partial_message(data["message_id"])
+
+        else:
+            message = await channel.send(embed=self._build_embed())
+            self._message = channel.get_partial_message(message.id)
+
+            await collection.update_one(
+                {"_id": channel.id},
+                {"$set": {"message_id": message.id}},
+                upsert=True,
+            )
+
+            # The board works unpinned, so a missing permission or a full pin list
+            # must not make the next change post another one.
+            try:
+                await message.pin()
+
+            except discord.HTTPException as e:
+                self.bot.log.warning(f"Failed to pin status board: {e}")
+
+        return self._message
+
+    def _build_embed(self) -> discord.Embed:
+        embed = discord.Embed(color=self.bot.embed_color)
+        embed.title = "Nerva Network Status"
+
+        embed.set_author(name="RoboNerva", icon_url=self.bot.user.avatar.url)
+
+        network = self.bot.get_cog("Network")
+
+        if network is None or (snapshot := network.snapshot) is None:
+            embed.description = "Waiting for network information..."
+            return embed
+
+        timestamp = snapshot.last_block_header["timestamp"]
+
+        embed.add_field(name="Height", value=snapshot.height)
+        embed.add_field(
+            name="Last Block",
+            value=f"<t:{timestamp}:T> (<t:{timestamp}:R>)",
+        )
+        embed.add_field(
+            name="Network Hashrate",
+            value=format_hashrate(network.hashrate(snapshot)),
+        )
+        embed.add_field(name="Circulating Supply", value=f"{snapshot.supply} XNV")
+
+        market = self.bot.get_cog("Market")
+        exchange, pair = self.bot.config.STATUS_BOARD_PRICE_PAIR
+
+        if market is not None and (
+            ticker := market.aggregator.ticker(exchange, pair)
+        ):
+            embed.add_field(name=f"Price ({pair})", value=ticker.last_price)
+
+        embed.set_footer(text="Last updated")
+        embed.timestamp = datetime.fromtimestamp(snapshot.fetched_at, UTC)
+
+        return embed
+
+    # Snapshot events only mark the board as dirty; this loop applies at most one
+    # edit per interval, so bursts of changes collapse into a single edit.
+    @tasks.loop(seconds=STATUS_BOARD_EDIT_INTERVAL)
+    async def _update_board(self) -> None:
+        if not self._dirty:
+            return
+
+        self._dirty = False
+
+        try:
+            if (message := await self._get_message()) is None:
+                return
+
+            await message.edit(embed=self._build_embed())
+
+        except discord.NotFound:
+            # The board was deleted, post a new one on the next change.
+            await self.bot.db.get_collection("status_board").delete_many({})
+            self._message = None
+            self._dirty = True
+
+        except Exception as e:
+            self.bot.log.exception("Failed to update status board.", exc_info=e)
+
+    @_update_board.before_loop
+    async def _before_update_board(self) -> None:
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: RoboNerva) -> None:
+    await bot.add_cog(StatusBoard(bot))
@@ -26,18 +26,68 @@ MONGODB_URI = "..."
 MONGODB_DATABASE = "..."
 
 COINGECKO_API_KEY = "..."
+# Calls per minute allowed by the CoinGecko API plan.
+COINGECKO_RATE_LIMIT = 30
+COINGECKO_CACHE_TTL = 60
+COINGECKO_MAX_RETRIES = 5
 
 GITHUB_TOKEN = "..."
 
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 10
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 30
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_REQUEST_TIMEOUT = 15
+
 AUTOPOST_VOTE_REMINDER_CHANNEL_ID = ...
 AUTOPOST_PRICE_UPDATE_CHANNEL_ID = ...
 RULES_CHANNEL_ID = ...
 WELCOME_CHANNEL_ID = ...
 TIPBOT_CHANNEL_ID = ...
+STATUS_BOARD_CHANNEL_ID = ...
+# Set to a channel ID to enable the new block feed.
+BLOCK_FEED_CHANNEL_ID = None
 
 AUTOPOST_MINUTES_AFTER_UTC = ...
 MARKET_HISTORY_HOURS_AFTER_UTC = ...
 
+NETWORK_POLL_INTERVAL = 15
+STATUS_BOARD_EDIT_INTERVAL = 10
+BLOCK_FEED_INTERVAL = 30
+BLOCK_FEED_TELEGRAM = False
+BLOCK_FEED_MEMPOOL_THRESHOLD = 50
+
+BLOCK_CACHE_SIZE = 1024
+BLOCK_CACHE_CONFIRMATIONS = 10
+
+BLOCK_STATS_WINDOW = 720
+BLOCK_HEADERS_BATCH_SIZE = 100
+
+API_NODE_FAILURE_THRESHOLD = 3
+API_NODE_COOLDOWN = 60
+API_NODE_MAX_LAG = 5
+API_NODE_FANOUT_TIMEOUT = 5
+API_NODE_HEDGING = True
+API_NODE_HEDGE_PERCENTILE = 95
+NODE_MONITOR_INTERVAL = 60
+
+SEED_NODES_RECORD = "seed.nerva.one"
+API_NODES_RECORD = "api_url.nerva.one"
+NODE_DISCOVERY_MIN_INTERVAL = 60
+NODE_DISCOVERY_MAX_INTERVAL = 3600
+
+SEED_NODE_PORT = 17565
+SEED_NODE_RPC_PORT = None
+SEED_PROBE_INTERVAL = 5
+SEED_PROBE_TIMEOUT = 5
+SEED_PROBE_CONCURRENCY = 16
+SEED_HISTORY_LENGTH = 24
+
+BAN_RECONCILE_INTERVAL = 10
+BAN_RECONCILE_CONCURRENCY = 8
+BAN_BULK_BATCH_SIZE = 25
+
 AUTOMOD_CHANNEL_HISTORY_MESSAGE_LIMIT = ...
 
 NAME_BLACKLIST_REGEX = [...]
@@ -47,6 +97,21 @@ NONKYC_MARKET_PAIRS = [...]
 CEXSWAP_MARKET_PAIRS = [...]
 NOIRTRADE_MARKET_PAIRS = [...]
 
+# Exchange adapters from utils/market.py to aggregate.
+MARKET_EXCHANGES = ["nonkyc", "cexswap", "noirtrade"]
+
+MARKET_REFRESH_INTERVAL = 30
+MARKET_REFRESH_TIMEOUT = 10
+# Exchange and pair whose last price is shown on the status board.
+STATUS_BOARD_PRICE_PAIR = ("nonkyc", "XNV/USDT")
+
+PRICE_TICK_INTERVAL = 5
+# Exchange pairs quoted in USD that are sampled alongside CoinGecko.
+PRICE_TICK_PAIRS = [("nonkyc", "XNV/USDT")]
+
+CHART_RENDER_WORKERS = 2
+CHART_CACHE_SIZE = 32
+
 NONKYC_REFERRAL_CODE = "..."
 
 INITIAL_EXTENSIONS = [...]
@@ -12,9 +12,11 @@ import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 
-import aiohttp
 import motor.motor_asyncio
 
+from utils.http import create_session
+from utils.coingecko import CoinGeckoClient
+
 from config import MONGODB_URI, MONGODB_DATABASE, COINGECKO_API_KEY
 
 logging.basicConfig(
@@ -40,106 +42,61 @@ async def main():
     db = client.get_database(MONGODB_DATABASE)
     collection = db[COLLECTION_NAME]
 
-    for i in range(1, 365):
-        yesterday_date = datetime.now(UTC) - timedelta(days=i)
-
-        start_timestamp = int(
-            yesterday_date.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ).timestamp()
-        )
-        end_timestamp = int(
-            (yesterday_date + timedelta(days=1))
-            .replace(hour=0, minute=0, second=0, microsecond=0)
-            .timestamp()
-        )
-
-        headers = {"x-cg-demo-api-key": COINGECKO_API_KEY}
-        params = {"vs_currency": "usd", "from": start_timestamp, "to": end_timestamp}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://api.coingecko.com/api/v3/coins/nerva/market_chart/range",
-                    params=params,
-                    headers=headers,
-                ) as res:
-                    data = await res.json()
-
-                    prices = data["prices"]
-                    volumes = data["total_volumes"]
-
-                    opening_price = prices[0][1]
-                    closing_price = prices[-1][1]
-                    high_price = max([price[1] for price in prices])
-                    low_price = min([price[1] for price in prices])
-                    volume = volumes[0][1]
-
-                    await collection.insert_one(
-                        {
-                            "_id": yesterday_date.replace(
-                                hour=0, minute=0, second=0, microsecond=0
-                            ),
-                            "opening": round(opening_price, 4),
-                            "closing": round(closing_price, 4),
-                            "high": round(high_price, 4),
-                            "low": round(low_price, 4),
-                            "volume": round(volume, 2),
-                        }
-                    )
-
-                    logging.info(
-                        f"Inserted data for {yesterday_date.strftime('%Y-%m-%d')}"
-                    )
-
-        except Exception as e:
-            _ = e
-
-            logging.info("Rate limited, waiting for 60 seconds...")
-            await asyncio.sleep(60)
+    # The client paces requests to the API plan's rate limit and backs off on
+    # 429 responses, so the days can be fetched back to back.
+    async with create_session() as session:
+        coingecko = CoinGeckoClient(session, COINGECKO_API_KEY)
+
+        for i in range(1, 365):
+            yesterday_date = datetime.now(UTC) - timedelta(days=i)
+
+            start_timestamp = int(
+                yesterday_date.replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                ).timestamp()
+            )
+            end_timestamp = int(
+                (yesterday_date + timedelta(days=1))
+                .replace(hour=0, minute=0, second=0, microsecond=0)
+                .timestamp()
+            )
 
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        "https://api.coingecko.com/api/v3/coins/nerva/market_chart/range",
-                        params=params,
-                        headers=headers,
-                    ) as res:
-                        data = await res.json()
-
-                        prices = data["prices"]
-                        volumes = data["total_volumes"]
-
-                        opening_price = prices[0][1]
-                        closing_price = prices[-1][1]
-                        high_price = max([price[1] for price in prices])
-                        low_price = min([price[1] for price in prices])
-                        volume = volumes[0][1]
-
-                        await collection.insert_one(
-                            {
-                                "_id": yesterday_date.replace(
-                                    hour=0, minute=0, second=0, microsecond=0
-                                ),
-                                "opening": round(opening_price, 4),
-                                "closing": round(closing_price, 4),
-                                "high": round(high_price, 4),
-                                "low": round(low_price, 4),
-                                "volume": round(volume, 2),
-                            }
-                        )
-
-                        logging.info(
-                            f"Inserted data for {yesterday_date.strftime('%Y-%m-%d')}"
-                        )
+                data = await coingecko.market_chart_range(
+                    start_timestamp, end_timestamp
+                )
+
+                prices = data["prices"]
+                volumes = data["total_volumes"]
+
+                opening_price = prices[0][1]
+                closing_price = prices[-1][1]
+                high_price = max([price[1] for price in prices])
+                low_price = min([price[1] for price in prices])
+                volume = volumes[0][1]
+
+                await collection.insert_one(
+                    {
+                        "_id": yesterday_date.replace(
+                            hour=0, minute=0, second=0, microsecond=0
+                        ),
+                        "opening": round(opening_price, 4),
+                        "closing": round(closing_price, 4),
+                        "high": round(high_price, 4),
+                        "low": round(low_price, 4),
+                        "volume": round(volume, 2),
+                    }
+                )
+
+                logging.info(
+                    f"Inserted data for {yesterday_date.strftime('%Y-%m-%d')}"
+                )
 
             except Exception as e:
                 logging.info(
                     e.__str__() + " - " + yesterday_date.strftime("%Y-%m-%d")
                 )
 
-            continue
-
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Iterable, Optional
+
+import math
+from array import array
+from datetime import datetime
+from statistics import stdev
+
+
+class PriceHistory:
+    """Daily closing prices held as a contiguous array of floats.
+
+    A decade of daily closes is under 30 KB, so every statistic below is a
+    single pass over memory instead of a query over the price collection.
+    """
+
+    def __init__(self):
+        self.dates: list[datetime] = list()
+        self.closes: array[float] = array("d")
+
+    def __len__(self) -> int:
+        return len(self.closes)
+
+    def load(self, documents: Iterable[Mapping[str, Any]]) -> None:
+        """Replace the history with daily documents sorted by date."""
+        self.dates.clear()
+        self.closes = array("d")
+
+        for document in documents:
+            if document.get("closing") is not None:
+                self.dates.append(document["_id"])
+                self.closes.append(document["closing"])
+
+    def append(self, date: datetime, close: float) -> None:
+        """Add a day's close, replacing it if the day is already the latest."""
+        if self.dates and self.dates[-1] == date:
+            self.closes[-1] = close
+
+        elif not self.dates or self.dates[-1] < date:
+            self.dates.append(date)
+            self.closes.append(close)
+
+    def sma(self, window: int) -> Optional[float]:
+        if len(self) < window:
+            return None
+
+        return math.fsum(self.closes[-window:]) / window
+
+    def ema(self, window: int) -> Optional[float]:
+        if len(self) < window:
+            return None
+
+        alpha = 2 / (window + 1)
+
+        # Seed with the SMA of the first window, as is conventional.
+        value = math.fsum(self.closes[:window]) / window
+
+        for close in self.closes[window:]:
+            value = alpha * close + (1 - alpha) * value
+
+        return value
+
+    def volatility(self, window: int) -> Optional[float]:
+        """Annualised standard deviation of daily log returns, as a percentage."""
+        if len(self) < window + 1:
+            return None
+
+        closes = self.closes[-window - 1 :]
+
+        if min(closes) <= 0:
+            return None
+
+        returns = [
+            math.log(closes[i] / closes[i - 1]) for i in range(1, len(closes))
+        ]
+
+        return stdev(returns) * math.sqrt(365) * 100
+
+    def max_drawdown(self) -> Optional[tuple[float, datetime, datetime]]:
+        """Largest peak-to-trough fall as a percentage, with its peak and trough."""
+        if len(self) < 2:
+            return None
+
+        peak_index, drawdown, peak_date, trough_date = 0, 0.0, None, None
+
+        for i, close in enumerate(self.closes):
+            if close > self.closes[peak_index]:
+                peak_index = i
+                continue
+
+            if self.closes[peak_index] <= 0:
+                continue
+
+            fall = (self.closes[peak_index] - close) / self.closes[peak_index]
+
+            if fall > drawdown:
+                drawdown = fall
+                peak_date, trough_date = self.dates[peak_index], self.dates[i]
+
+        if peak_date is None:
+            return None
+
+        return drawdown * 100, peak_date, trough_date
+
+    def period_return(self, days: int) -> Optional[float]:
+        """Return over the last `days` closes, as a percentage."""
+        if len(self) < days + 1 or self.closes[-days - 1] <= 0:
+            return None
+
+        return (self.closes[-1] / self.closes[-days - 1] - 1) * 100
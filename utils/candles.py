@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from datetime import datetime
+
+
+class Candle:
+    """Open, high, low and close of a price over one period."""
+
+    __slots__ = ("start", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: datetime, price: float, volume: Optional[float]):
+        self.start: datetime = start
+        self.open: float = price
+        self.high: float = price
+        self.low: float = price
+        self.close: float = price
+        self.volume: Optional[float] = volume
+
+    def update(self, price: float, volume: Optional[float]) -> None:
+        self.high = max(self.high, price)
+        self.low = min(self.low, price)
+        self.close = price
+
+        if volume is not None:
+            self.volume = volume
+
+
+class CandleBuilder:
+    """Builds candles of one resolution incrementally from price ticks."""
+
+    RESOLUTIONS = ("hour", "day")
+
+    def __init__(self, resolution: str):
+        if resolution not in self.RESOLUTIONS:
+            raise ValueError(f"Unsupported resolution: {resolution}")
+
+        self.resolution: str = resolution
+        self.current: Optional[Candle] = None
+
+    def bucket(self, timestamp: datetime) -> datetime:
+        if self.resolution == "hour":
+            return timestamp.replace(minute=0, second=0, microsecond=0)
+
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def add(
+        self, timestamp: datetime, price: float, volume: Optional[float] = None
+    ) -> Optional[Candle]:
+        """Add a tick, returning the previous candle once its period has ended."""
+        start = self.bucket(timestamp)
+
+        if self.current is not None and self.current.start == start:
+            self.current.update(price, volume)
+            return None
+
+        finished, self.current = self.current, Candle(start, price, volume)
+
+        return finished
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import zlib
+import struct
+
+# Candles are (open, high, low, close, volume) tuples, oldest first.
+Candle = tuple[float, float, float, float, Optional[float]]
+
+BACKGROUND = (43, 45, 49)
+GRID = (64, 66, 73)
+LINE = (88, 101, 242)
+UP = (35, 165, 90)
+DOWN = (218, 55, 60)
+VOLUME = (96, 99, 110)
+
+
+class Canvas:
+    """Minimal RGB raster that can be encoded as a PNG."""
+
+    def __init__(self, width: int, height: int, color: tuple[int, int, int]):
+        self.width: int = width
+        self.height: int = height
+        self._pixels: bytearray = bytearray(color * (width * height))
+
+    def fill(
+        self, x0: int, y0: int, x1: int, y1: int, color: tuple[int, int, int]
+    ) -> None:
+        x0, x1 = sorted((max(0, x0), min(self.width - 1, x1)))
+        y0, y1 = sorted((max(0, y0), min(self.height - 1, y1)))
+
+        row = bytes(color) * (x1 - x0 + 1)
+
+        for y in range(y0, y1 + 1):
+            offset = (y * self.width + x0) * 3
+            self._pixels[offset : offset + len(row)] = row
+
+    def line(
+        self, x0: int, y0: int, x1: int, y1: int, color: tuple[int, int, int]
+    ) -> None:
+        # Bresenham's line algorithm, drawn two pixels thick for legibility.
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+        error = dx + dy
+
+        while True:
+            self.fill(x0, y0, x0 + 1, y0 + 1, color)
+
+            if x0 == x1 and y0 == y1:
+                break
+
+            step = 2 * error
+
+            if step >= dy:
+                error += dy
+                x0 += sx
+
+            if step <= dx:
+                error += dx
+                y0 += sy
+
+    def to_png(self) -> bytes:
+        stride = self.width * 3
+        raw = b"".join(
+            b"\x00" + bytes(self._pixels[y * stride : (y + 1) * stride])
+            for y in range(self.height)
+        )
+
+        def _chunk(kind: bytes, data: bytes) -> bytes:
+            return (
+                struct.pack(">I", len(data))
+                + kind
+                + data
+                + struct.pack(">I", zlib.crc32(kind + data))
+            )
+
+        return (
+            b"\x89PNG\r\n\x1a\n"
+            + _chunk(
+                b"IHDR",
+                struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0),
+            )
+            + _chunk(b"IDAT", zlib.compress(raw, 9))
+            + _chunk(b"IEND", b"")
+        )
+
+
+def render_chart(
+    candles: Sequence[Candle],
+    style: str = "candlestick",
+    width: int = 800,
+    height: int = 400,
+) -> bytes:
+    """Render a price chart with a volume pane below it as PNG bytes.
+
+    This is a pure function of its arguments, so it can run in a process pool.
+    """
+    canvas = Canvas(width, height, BACKGROUND)
+
+    margin = 10
+    price_bottom = int(height * 0.75)
+    volume_top = price_bottom + margin
+
+    low = min(candle[2] for candle in candles)
+    high = max(candle[1] for candle in candles)
+    span = (high - low) or 1.0
+    max_volume = max((candle[4] or 0.0 for candle in candles), default=0.0) or 1.0
+
+    def _y(price: float) -> int:
+        return int(price_bottom - (price - low) / span * (price_bottom - margin))
+
+    for i in range(5):
+        y = margin + i * (price_bottom - margin) // 4
+        canvas.fill(margin, y, width - margin, y, GRID)
+
+    slot = (width - 2 * margin) / len(candles)
+    body = max(1, int(slot * 0.6))
+    previous: Optional[tuple[int, int]] = None
+
+    for i, (opening, candle_high, candle_low, closing, volume) in enumerate(candles):
+        x = int(margin + slot * i + slot / 2)
+        color = UP if closing >= opening else DOWN
+
+        if volume:
+            canvas.fill(
+                x - body // 2,
+                int(
+                    height
+                    - margin
+                    - volume / max_volume * (height - margin - volume_top)
+                ),
+                x + body // 2,
+                height - margin,
+                VOLUME,
+            )
+
+        if style == "line":
+            if previous is not None:
+                canvas.line(*previous, x, _y(closing), LINE)
+
+            previous = (x, _y(closing))
+            continue
+
+        canvas.fill(x, _y(candle_high), x, _y(candle_low), color)
+        canvas.fill(
+            x - body // 2,
+            _y(max(opening, closing)),
+            x + body // 2,
+            _y(min(opening, closing)),
+            color,
+        )
+
+    return canvas.to_png()
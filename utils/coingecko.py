@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import time
+import asyncio
+
+import aiohttp
+
+from utils.http import json_loads
+from utils.cache import LRUCache
+
+from config import (
+    COINGECKO_CACHE_TTL,
+    COINGECKO_RATE_LIMIT,
+    COINGECKO_MAX_RETRIES,
+)
+
+COINGECKO_API_URL = "https://api.coingecko.com/api/v3"
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per `period` seconds, with bursts up to `rate`."""
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate: int = rate
+        self.period: float = period
+        self._tokens: float = rate
+        self._updated_at: float = time.monotonic()
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.rate,
+            self._tokens + (now - self._updated_at) * self.rate / self.period,
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        # The lock keeps waiters in FIFO order while one of them sleeps.
+        async with self._lock:
+            self._refill()
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+                self._refill()
+
+            self._tokens -= 1
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the server reported a rate limit."""
+        self._tokens = 0
+        self._updated_at = time.monotonic()
+
+
+class CoinGeckoClient:
+    """Rate-limited, caching CoinGecko API client.
+
+    Requests pass through a token bucket sized to the API plan. Responses are
+    cached per endpoint and parameters, and concurrent identical requests share
+    a single HTTP call. A 429 response drains the bucket and is retried after
+    `Retry-After` (or an exponential backoff).
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        rate_limit: int = COINGECKO_RATE_LIMIT,
+        cache_ttl: float = COINGECKO_CACHE_TTL,
+        max_retries: int = COINGECKO_MAX_RETRIES,
+    ):
+        self.session: aiohttp.ClientSession = session
+        self.api_key: str = api_key
+        self.cache_ttl: float = cache_ttl
+        self.max_retries: int = max_retries
+        self._bucket: TokenBucket = TokenBucket(rate_limit)
+        self._cache: LRUCache[tuple, tuple[float, Any]] = LRUCache(256)
+        self._inflight: dict[tuple, asyncio.Future] = dict()
+
+    async def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+
+            async with self.session.get(
+                f"{COINGECKO_API_URL}{endpoint}",
+                params=params,
+                headers={"x-cg-demo-api-key": self.api_key},
+            ) as res:
+                if res.status != 429 or attempt == self.max_retries:
+                    res.raise_for_status()
+                    return await res.json(loads=json_loads, content_type=None)
+
+                retry_after = res.headers.get("Retry-After", "")
+
+            self._bucket.drain()
+            await asyncio.sleep(
+                float(retry_after) if retry_after.isdigit() else 2**attempt * 5
+            )
+
+    async def _fetch(
+        self, key: tuple, endpoint: str, params: dict[str, Any], ttl: float
+    ) -> Any:
+        try:
+            data = await self._request(endpoint, params)
+            self._cache.set(key, (time.time() + ttl, data))
+
+            return data
+
+        finally:
+            del self._inflight[key]
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """GET an API endpoint, e.g. `/coins/markets`, through the cache."""
+        params = params or dict()
+        key = (endpoint, tuple(sorted(params.items())))
+
+        if (cached := self._cache.get(key)) is not None and cached[0] > time.time():
+            return cached[1]
+
+        if (future := self._inflight.get(key)) is None:
+            future = asyncio.ensure_future(
+                self._fetch(key, endpoint, params, ttl or self.cache_ttl)
+            )
+            self._inflight[key] = future
+
+        # Shield the shared request, so one caller being cancelled does not
+        # cancel it for every other caller.
+        return await asyncio.shield(future)
+
+    async def markets(self, coin: str = "nerva", vs_currency: str = "usd") -> Any:
+        return await self.get(
+            "/coins/markets", {"vs_currency": vs_currency, "ids": coin}
+        )
+
+    async def market_chart_range(
+        self,
+        start: int,
+        end: int,
+        coin: str = "nerva",
+        vs_currency: str = "usd",
+    ) -> Any:
+        return await self.get(
+            f"/coins/{coin}/market_chart/range",
+            {"vs_currency": vs_currency, "from": start, "to": end},
+        )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+
+from config import (
+    HTTP_DNS_CACHE_TTL,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_REQUEST_TIMEOUT,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+)
+
+try:
+    # orjson ships with discord.py[speed]
+    from orjson import loads as json_loads
+
+except ImportError:
+    from json import loads as json_loads
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create the pooled HTTP session shared by the bot, cogs and tasks."""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        enable_cleanup_closed=True,
+    )
+
+    timeout = aiohttp.ClientTimeout(
+        total=HTTP_REQUEST_TIMEOUT, sock_connect=HTTP_CONNECT_TIMEOUT
+    )
+
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def fetch_json(session: aiohttp.ClientSession, url: str, **kwargs) -> Any:
+    """Send a GET request and decode the JSON body, raising on error statuses."""
+    async with session.get(url, **kwargs) as res:
+        res.raise_for_status()
+        return await res.json(loads=json_loads, content_type=None)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Union, Iterable
+
+import re
+import bisect
+import ipaddress
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_networks(text: str) -> tuple[list[IPNetwork], list[str]]:
+    """Parse IPs and CIDR ranges separated by whitespace, commas or semicolons.
+
+    Anything after a `#` on a line is ignored. Returns the parsed networks and
+    the entries that could not be parsed.
+    """
+    networks, invalid = list(), list()
+
+    for line in text.splitlines():
+        for entry in re.split(r"[\s,;]+", line.partition("#")[0]):
+            if not entry:
+                continue
+
+            try:
+                networks.append(ipaddress.ip_network(entry, strict=False))
+
+            except ValueError:
+                invalid.append(entry)
+
+    return networks, invalid
+
+
+def format_network(network: IPNetwork) -> str:
+    """Format a single-address network as a plain IP, others in CIDR notation."""
+    if network.num_addresses == 1:
+        return str(network.network_address)
+
+    return str(network)
+
+
+class IPRangeSet:
+    """Sorted, non-overlapping address intervals built from IPs and CIDR ranges.
+
+    Duplicates, overlaps and adjacent ranges are merged on construction, so a
+    botnet list of thousands of entries usually collapses to far fewer ranges.
+    """
+
+    def __init__(self, networks: Iterable[IPNetwork]):
+        self._intervals: dict[int, tuple[list[int], list[int]]] = dict()
+
+        by_version: dict[int, list[IPNetwork]] = dict()
+
+        for network in networks:
+            by_version.setdefault(network.version, list()).append(network)
+
+        for version, items in by_version.items():
+            starts, ends = list(), list()
+
+            for network in sorted(items, key=lambda n: int(n.network_address)):
+                start = int(network.network_address)
+                end = int(network.broadcast_address)
+
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+
+                else:
+                    starts.append(start)
+                    ends.append(end)
+
+            self._intervals[version] = (starts, ends)
+
+    def __len__(self) -> int:
+        return sum(len(starts) for starts, _ in self._intervals.values())
+
+    def __contains__(self, address: str) -> bool:
+        ip = ipaddress.ip_address(address)
+
+        if (intervals := self._intervals.get(ip.version)) is None:
+            return False
+
+        starts, ends = intervals
+        index = bisect.bisect_right(starts, int(ip)) - 1
+
+        return index >= 0 and int(ip) <= ends[index]
+
+    @property
+    def num_addresses(self) -> int:
+        return sum(
+            end - start + 1
+            for starts, ends in self._intervals.values()
+            for start, end in zip(starts, ends)
+        )
+
+    def networks(self) -> list[IPNetwork]:
+        """Return the minimal list of CIDR blocks covering every interval."""
+        networks = list()
+
+        for version, (starts, ends) in sorted(self._intervals.items()):
+            address = (
+                ipaddress.IPv4Address if version == 4 else ipaddress.IPv6Address
+            )
+
+            for start, end in zip(starts, ends):
+                networks.extend(
+                    ipaddress.summarize_address_range(address(start), address(end))
+                )
+
+        return networks
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Iterable, Optional
+
+import time
+import asyncio
+from types import MappingProxyType
+from datetime import UTC, datetime
+from dataclasses import dataclass
+
+import aiohttp
+from dateutil.parser import parse
+
+from utils.http import fetch_json
+
+from config import MARKET_REFRESH_TIMEOUT
+
+MARKET_API_URL = "https://nervaapi.sn1f3rt.dev/market"
+
+
+def parse_timestamp(value: str) -> int:
+    """Parse an ISO 8601 timestamp into a Unix timestamp.
+
+    `datetime.fromisoformat` handles the formats the exchanges send and is much
+    faster than dateutil, which is only used as a fallback.
+    """
+    try:
+        timestamp = datetime.fromisoformat(value)
+
+    except ValueError:
+        timestamp = parse(value)
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+
+    return int(timestamp.timestamp())
+
+
+class Ticker:
+    """Normalised market data of a single trading pair."""
+
+    __slots__ = (
+        "pair",
+        "last_price",
+        "volume",
+        "high",
+        "low",
+        "bid",
+        "ask",
+        "change_24h",
+        "last_trade",
+    )
+
+    def __init__(
+        self,
+        pair: str,
+        last_price: Any,
+        volume: Any,
+        high: Any,
+        low: Any,
+        bid: Any = None,
+        ask: Any = None,
+        change_24h: Any = None,
+        last_trade: Optional[int] = None,
+    ):
+        self.pair: str = pair
+        self.last_price: Any = last_price
+        self.volume: Any = volume
+        self.high: Any = high
+        self.low: Any = low
+        self.bid: Any = bid
+        self.ask: Any = ask
+        self.change_24h: Any = change_24h
+        self.last_trade: Optional[int] = last_trade
+
+
+class ExchangeAdapter:
+    """Fetches and normalises the tickers of one exchange.
+
+    Pairs and links are read from the `<NAME>_MARKET_PAIRS` and
+    `<NAME>_MARKET_LINKS` config settings. Subclasses set the class attributes
+    and override `normalise` if the exchange's fields need mapping.
+    """
+
+    name: str
+    display_name: str
+    thumbnail_url: str
+
+    def __init__(self, config: Any):
+        self.pairs: list[str] = list(
+            getattr(config, f"{self.name.upper()}_MARKET_PAIRS")
+        )
+        self.links: dict[str, str] = getattr(
+            config, f"{self.name.upper()}_MARKET_LINKS", dict()
+        )
+
+    @property
+    def url(self) -> str:
+        return f"{MARKET_API_URL}/{self.name}"
+
+    def normalise(self, pair: str, entry: Mapping[str, Any]) -> Ticker:
+        return Ticker(
+            pair=pair,
+            last_price=entry.get("last_price", "N/A"),
+            volume=entry.get("volume", "N/A"),
+            high=entry.get("high", "N/A"),
+            low=entry.get("low", "N/A"),
+            bid=entry.get("bid"),
+            ask=entry.get("ask"),
+            change_24h=entry.get("change_24h"),
+            last_trade=(
+                parse_timestamp(entry["last_trade"])
+                if entry.get("last_trade")
+                else None
+            ),
+        )
+
+    async def fetch(self, session: aiohttp.ClientSession) -> dict[str, Ticker]:
+        data = await fetch_json(session, self.url)
+
+        if data.get("status") != "success":
+            raise RuntimeError(f"API error for {self.name}")
+
+        return {
+            pair: self.normalise(pair, data["result"][pair])
+            for pair in self.pairs
+            if pair in data["result"]
+        }
+
+
+ADAPTERS: dict[str, type[ExchangeAdapter]] = dict()
+
+
+def register_adapter(adapter: type[ExchangeAdapter]) -> type[ExchangeAdapter]:
+    ADAPTERS[adapter.name] = adapter
+    return adapter
+
+
+@register_adapter
+class NonKYCAdapter(ExchangeAdapter):
+    name = "nonkyc"
+    display_name = "NonKYC"
+    thumbnail_url = "https://nonkyc.io/images/mediakit/NonKYC-logo-384.png"
+
+
+@register_adapter
+class CexSwapAdapter(ExchangeAdapter):
+    name = "cexswap"
+    display_name = "CexSwap"
+    thumbnail_url = "https://cexswap.cc/icons/favicon-32x32.png"
+
+
+@register_adapter
+class NoirTradeAdapter(ExchangeAdapter):
+    name = "noirtrade"
+    display_name = "NoirTrade"
+    thumbnail_url = "https://noirtrade.com/logo.png"
+
+
+@dataclass(frozen=True, slots=True)
+class MarketSnapshot:
+    """Tickers of one exchange as of a single refresh."""
+
+    exchange: str
+    tickers: Mapping[str, Ticker]
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the snapshot was taken."""
+        return time.time() - self.fetched_at
+
+
+class MarketAggregator:
+    """Keeps an in-memory snapshot of every configured exchange.
+
+    Exchanges are refreshed concurrently, each under its own deadline. A failed
+    refresh keeps the exchange's previous snapshot, so commands keep answering
+    with slightly older data rather than erroring.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        adapters: Iterable[ExchangeAdapter],
+        timeout: float = MARKET_REFRESH_TIMEOUT,
+    ):
+        self.session: aiohttp.ClientSession = session
+        self.adapters: dict[str, ExchangeAdapter] = {
+            adapter.name: adapter for adapter in adapters
+        }
+        self.timeout: float = timeout
+        self.snapshots: dict[str, MarketSnapshot] = dict()
+
+    def get(self, exchange: str) -> Optional[MarketSnapshot]:
+        return self.snapshots.get(exchange)
+
+    def ticker(self, exchange: str, pair: str) -> Optional[Ticker]:
+        if (snapshot := self.snapshots.get(exchange)) is None:
+            return None
+
+        return snapshot.tickers.get(pair)
+
+    async def _refresh(self, adapter: ExchangeAdapter) -> None:
+        tickers = await asyncio.wait_for(adapter.fetch(self.session), self.timeout)
+
+        self.snapshots[adapter.name] = MarketSnapshot(
+            adapter.name, MappingProxyType(tickers), time.time()
+        )
+
+    async def refresh(self) -> dict[str, BaseException]:
+        """Refresh every exchange, returning the errors of those that failed."""
+        results = await asyncio.gather(
+            *(self._refresh(adapter) for adapter in self.adapters.values()),
+            return_exceptions=True,
+        )
+
+        return {
+            exchange: result
+            for exchange, result in zip(self.adapters, results)
+            if isinstance(result, BaseException)
+        }
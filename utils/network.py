@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Iterable, Optional
+
+import time
+from types import MappingProxyType
+from statistics import linear_regression
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class NetworkSnapshot:
+    """Point-in-time view of the network as reported by a daemon node."""
+
+    height: int
+    target_height: int
+    difficulty: int
+    version: str
+    database_size: int
+    incoming_connections_count: int
+    outgoing_connections_count: int
+    top_block_hash: str
+    tx_pool_size: int
+    last_block_header: Mapping[str, Any]
+    supply: float
+    fetched_at: float
+
+    @classmethod
+    def from_daemon(
+        cls,
+        info: Mapping[str, Any],
+        last_block_header: Mapping[str, Any],
+        supply: float,
+    ) -> NetworkSnapshot:
+        """Build a snapshot from daemon info, last block header and supply."""
+        return cls(
+            height=info["height"],
+            target_height=info["target_height"],
+            difficulty=info["difficulty"],
+            version=info["version"],
+            database_size=info["database_size"],
+            incoming_connections_count=info["incoming_connections_count"],
+            outgoing_connections_count=info["outgoing_connections_count"],
+            top_block_hash=info["top_block_hash"],
+            tx_pool_size=info.get("tx_pool_size", 0),
+            last_block_header=MappingProxyType(dict(last_block_header)),
+            supply=supply,
+            fetched_at=time.time(),
+        )
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the snapshot was taken."""
+        return time.time() - self.fetched_at
+
+
+class BlockWindow:
+    """Rolling window of the most recent block headers.
+
+    Headers are stored as parallel columns so the statistics below are single
+    passes over plain floats rather than lookups into header dicts.
+    """
+
+    def __init__(self, size: int):
+        self.size: int = size
+        self._heights: deque[int] = deque(maxlen=size)
+        self._hashes: deque[str] = deque(maxlen=size)
+        self._timestamps: deque[float] = deque(maxlen=size)
+        self._difficulties: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._heights)
+
+    @property
+    def tip_height(self) -> Optional[int]:
+        return self._heights[-1] if self._heights else None
+
+    def clear(self) -> None:
+        self._heights.clear()
+        self._hashes.clear()
+        self._timestamps.clear()
+        self._difficulties.clear()
+
+    def _pop(self) -> None:
+        self._heights.pop()
+        self._hashes.pop()
+        self._timestamps.pop()
+        self._difficulties.pop()
+
+    def extend(self, headers: Iterable[Mapping[str, Any]]) -> None:
+        """Append headers in height order, dropping the window on a reorg or gap.
+
+        A header at the tip's height with a different hash replaces the tip.
+        """
+        for header in sorted(headers, key=lambda h: h["height"]):
+            tip_height = self.tip_height
+
+            if tip_height is not None and header["height"] == tip_height:
+                if header["hash"] == self._hashes[-1]:
+                    continue
+
+                self._pop()
+                tip_height = self.tip_height
+
+            elif tip_height is not None and header["height"] < tip_height:
+                continue
+
+            if tip_height is not None and (
+                header["height"] != tip_height + 1
+                or header["prev_hash"] != self._hashes[-1]
+            ):
+                self.clear()
+
+            self._heights.append(header["height"])
+            self._hashes.append(header["hash"])
+            self._timestamps.append(header["timestamp"])
+            self._difficulties.append(header["difficulty"])
+
+    @property
+    def block_time(self) -> Optional[float]:
+        """Average seconds between blocks across the window."""
+        if len(self) < 2:
+            return None
+
+        return (self._timestamps[-1] - self._timestamps[0]) / (len(self) - 1)
+
+    @property
+    def hashrate(self) -> Optional[float]:
+        """Hashes per second, i.e. work done across the window over its duration."""
+        if len(self) < 2 or self._timestamps[-1] <= self._timestamps[0]:
+            return None
+
+        # The first block's work was done before the window's first timestamp.
+        work = sum(self._difficulties) - self._difficulties[0]
+
+        return work / (self._timestamps[-1] - self._timestamps[0])
+
+    @property
+    def difficulty_trend(self) -> Optional[float]:
+        """Fitted difficulty change across the window, as a percentage."""
+        if len(self) < 2:
+            return None
+
+        slope, intercept = linear_regression(self._heights, self._difficulties)
+
+        start = slope * self._heights[0] + intercept
+
+        if start <= 0:
+            return None
+
+        return slope * (self._heights[-1] - self._heights[0]) / start * 100
@@ -0,0 +1,535 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+import time
+import asyncio
+from collections import Counter, deque
+from dataclasses import dataclass
+
+import aiohttp
+
+from utils.http import fetch_json
+
+from config import (
+    SEED_NODE_PORT,
+    API_NODE_MAX_LAG,
+    API_NODE_COOLDOWN,
+    SEED_PROBE_TIMEOUT,
+    SEED_HISTORY_LENGTH,
+    SEED_PROBE_CONCURRENCY,
+    API_NODE_FANOUT_TIMEOUT,
+    API_NODE_HEDGE_PERCENTILE,
+    API_NODE_FAILURE_THRESHOLD,
+)
+
+
+class NodeError(RuntimeError):
+    """A node answered with a JSON-RPC error or a non-OK status."""
+
+    def __init__(self, url: str, error: Any):
+        super().__init__(f"{url} returned an error: {error}")
+        self.url: str = url
+        self.error: Any = error
+
+
+class NodeHealth:
+    """Rolling health statistics of a single API node."""
+
+    __slots__ = (
+        "url",
+        "latency",
+        "error_rate",
+        "height",
+        "failures",
+        "opened_at",
+        "diverged",
+    )
+
+    def __init__(self, url: str):
+        self.url: str = url
+        self.latency: Optional[float] = None
+        self.error_rate: float = 0.0
+        self.height: Optional[int] = None
+        self.failures: int = 0
+        self.opened_at: Optional[float] = None
+        self.diverged: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the circuit breaker is currently ejecting this node."""
+        if self.opened_at is None:
+            return False
+
+        # Once the cooldown has passed the node is let through again (half-open);
+        # a single failure re-opens the circuit straight away.
+        return time.monotonic() - self.opened_at < API_NODE_COOLDOWN
+
+
+@dataclass(frozen=True, slots=True)
+class NodeResult:
+    """Outcome of a request sent to a single node during a fan-out."""
+
+    url: str
+    status: str
+    latency: float
+    data: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "OK"
+
+
+class NodeRegistry:
+    """Health-scored set of API nodes used to route daemon requests."""
+
+    ALPHA = 0.2
+    HEDGE_MIN_SAMPLES = 20
+    HEDGE_DEFAULT_DELAY = 1.0
+
+    def __init__(self):
+        self._nodes: dict[str, NodeHealth] = dict()
+        self._latencies: deque[float] = deque(maxlen=256)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def urls(self) -> list[str]:
+        return list(self._nodes)
+
+    @property
+    def nodes(self) -> list[NodeHealth]:
+        return list(self._nodes.values())
+
+    @property
+    def top_height(self) -> Optional[int]:
+        heights = [node.height for node in self._nodes.values() if node.height]
+        return max(heights) if heights else None
+
+    def replace(self, urls: Iterable[str]) -> None:
+        """Atomically swap in a new node list, keeping stats of known nodes."""
+        self._nodes = {
+            url: self._nodes.get(url) or NodeHealth(url)
+            for url in dict.fromkeys(urls)
+        }
+
+    def score(self, node: NodeHealth, top_height: Optional[int] = None) -> float:
+        """Lower is better. Unmeasured nodes score 0 so they get probed first."""
+        score = (node.latency or 0.0) * (1.0 + 10.0 * node.error_rate)
+
+        if node.diverged or (
+            top_height
+            and node.height
+            and top_height - node.height > API_NODE_MAX_LAG
+        ):
+            score += 1_000.0
+
+        return score
+
+    def ranked(self) -> list[str]:
+        """Return node URLs ordered from healthiest to least healthy."""
+        nodes = list(self._nodes.values())
+
+        # If every circuit is open, fall back to the least bad nodes.
+        candidates = [node for node in nodes if not node.is_open] or nodes
+
+        top_height = self.top_height
+        candidates.sort(key=lambda n: self.score(n, top_height))
+
+        return [node.url for node in candidates]
+
+    def best(self) -> Optional[str]:
+        """Return the URL of the healthiest node, if any."""
+        ranked = self.ranked()
+        return ranked[0] if ranked else None
+
+    @property
+    def hedge_delay(self) -> float:
+        """Seconds to wait on the first node before hedging to a second one."""
+        if len(self._latencies) < self.HEDGE_MIN_SAMPLES:
+            return self.HEDGE_DEFAULT_DELAY
+
+        latencies = sorted(self._latencies)
+        index = int(len(latencies) * API_NODE_HEDGE_PERCENTILE / 100)
+
+        return latencies[min(index, len(latencies) - 1)]
+
+    def set_diverged(self, url: str, diverged: bool) -> None:
+        """Flag a node as lagging or forked so it is routed to last."""
+        if (node := self._nodes.get(url)) is not None:
+            node.diverged = diverged
+
+    def record_success(
+        self, url: str, latency: float, height: Optional[int] = None
+    ) -> None:
+        if (node := self._nodes.get(url)) is None:
+            return
+
+        node.latency = (
+            latency
+            if node.latency is None
+            else self.ALPHA * latency + (1 - self.ALPHA) * node.latency
+        )
+        node.error_rate *= 1 - self.ALPHA
+        self._latencies.append(latency)
+        node.failures = 0
+        node.opened_at = None
+
+        if height is not None:
+            node.height = height
+
+    def record_failure(self, url: str) -> None:
+        if (node := self._nodes.get(url)) is None:
+            return
+
+        node.error_rate = self.ALPHA + (1 - self.ALPHA) * node.error_rate
+        node.failures += 1
+
+        if node.failures >= API_NODE_FAILURE_THRESHOLD:
+            node.opened_at = time.monotonic()
+
+    async def fetch(
+        self,
+        session: aiohttp.ClientSession,
+        path: str,
+        node: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """Fetch `path` from `node` (or the healthiest one), recording the outcome."""
+        if (url := node or self.best()) is None:
+            raise RuntimeError("No API nodes are available.")
+
+        start = time.monotonic()
+
+        try:
+            data = await fetch_json(session, f"{url}{path}", **kwargs)
+
+        except Exception:
+            self.record_failure(url)
+            raise
+
+        result = data.get("result") if isinstance(data, dict) else None
+        status = result.get("status") if isinstance(result, dict) else None
+
+        # A fast error answer must not make a node look healthy.
+        if (isinstance(data, dict) and data.get("error")) or status not in (
+            None,
+            "OK",
+        ):
+            self.record_failure(url)
+            raise NodeError(url, data.get("error") or status)
+
+        # `get_info` responses carry the node's height, which feeds the lag check.
+        height = result.get("height") if isinstance(result, dict) else None
+
+        self.record_success(url, time.monotonic() - start, height)
+
+        return data
+
+    async def hedged_fetch(
+        self, session: aiohttp.ClientSession, path: str, **kwargs
+    ) -> Any:
+        """Fetch a read-only `path`, hedging to a second node on a slow answer.
+
+        If the healthiest node has not answered within `hedge_delay`, the same
+        request goes to the next healthiest node and the first success wins.
+        """
+        ranked = self.ranked()
+
+        if len(ranked) < 2:
+            return await self.fetch(session, path, **kwargs)
+
+        primary = asyncio.create_task(
+            self.fetch(session, path, node=ranked[0], **kwargs)
+        )
+        pending = {primary}
+
+        # The `try` covers the primary's first wait too, so a cancelled caller
+        # never leaves a request running.
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+
+            if done and not primary.exception():
+                return primary.result()
+
+            pending.add(
+                asyncio.create_task(
+                    self.fetch(session, path, node=ranked[1], **kwargs)
+                )
+            )
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    if not task.exception():
+                        return task.result()
+
+            # Every attempt failed, surface the primary node's error.
+            return primary.result()
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fan_out(
+        self,
+        session: aiohttp.ClientSession,
+        path: str,
+        timeout: float = API_NODE_FANOUT_TIMEOUT,
+        **kwargs,
+    ) -> list[NodeResult]:
+        """Send `path` to every node concurrently, each with its own deadline.
+
+        A node counts as OK when it answers in time with an RPC status of "OK".
+        """
+
+        async def _request(url: str) -> NodeResult:
+            start = time.monotonic()
+
+            try:
+                data = await asyncio.wait_for(
+                    self.fetch(session, path, node=url, **kwargs), timeout
+                )
+
+            except asyncio.TimeoutError:
+                self.record_failure(url)
+                return NodeResult(url, "timeout", time.monotonic() - start)
+
+            except Exception as e:
+                return NodeResult(url, "error", time.monotonic() - start, str(e))
+
+            result = data.get("result") if isinstance(data, dict) else None
+            status = result.get("status") if isinstance(result, dict) else None
+
+            return NodeResult(
+                url,
+                "OK" if status == "OK" else "error",
+                time.monotonic() - start,
+                data,
+            )
+
+        return list(await asyncio.gather(*(_request(url) for url in self._nodes)))
+
+
+@dataclass(frozen=True, slots=True)
+class NodeStatus:
+    """A node's view of the chain and how it compares to the majority."""
+
+    url: str
+    latency: float
+    height: Optional[int] = None
+    top_hash: Optional[str] = None
+    version: Optional[str] = None
+    issue: Optional[str] = None
+
+    @property
+    def diverged(self) -> bool:
+        return self.issue in ("lagging", "forked")
+
+
+def parse_version(version: str) -> tuple[int, ...]:
+    """Parse the numeric part of a daemon version, e.g. `0.2.0.1-release`."""
+    numbers = list()
+
+    for part in version.split("-")[0].split("."):
+        if not part.isdigit():
+            break
+
+        numbers.append(int(part))
+
+    return tuple(numbers)
+
+
+def classify_nodes(results: list[NodeResult]) -> list[NodeStatus]:
+    """Compare every node's `get_info` against the majority of responding nodes.
+
+    A node is "down" if it did not answer, "lagging" if it is more than
+    `API_NODE_MAX_LAG` blocks behind the majority, "forked" if it is at the
+    majority height on a different top block than a strict majority, and
+    "outdated" if it runs an older version than the newest one seen.
+    """
+    statuses, infos = list(), dict()
+
+    for result in results:
+        if result.ok:
+            infos[result.url] = result.data["result"]
+
+    tips = Counter(
+        (info["height"], info["top_block_hash"]) for info in infos.values()
+    )
+    ranked = tips.most_common(2)
+    majority_height, majority_hash = ranked[0][0] if ranked else (None, None)
+
+    # Nodes briefly split across competing tips have no majority to fork from.
+    if len(ranked) > 1 and ranked[1][1] == ranked[0][1]:
+        majority_hash = None
+    latest_version = max(
+        (parse_version(info["version"]) for info in infos.values()), default=()
+    )
+
+    for result in results:
+        if (info := infos.get(result.url)) is None:
+            statuses.append(NodeStatus(result.url, result.latency, issue="down"))
+            continue
+
+        height, top_hash = info["height"], info["top_block_hash"]
+
+        if majority_height - height > API_NODE_MAX_LAG:
+            issue = "lagging"
+
+        elif (
+            majority_hash is not None
+            and height == majority_height
+            and top_hash != majority_hash
+        ):
+            issue = "forked"
+
+        elif parse_version(info["version"]) < latest_version:
+            issue = "outdated"
+
+        else:
+            issue = None
+
+        statuses.append(
+            NodeStatus(
+                result.url, result.latency, height, top_hash, info["version"], issue
+            )
+        )
+
+    return statuses
+
+
+def split_address(
+    address: str, default_port: int = SEED_NODE_PORT
+) -> tuple[str, int]:
+    """Split `host`, `host:port` or `[v6]:port` into a host and port."""
+    if address.startswith("["):
+        host, _, port = address[1:].partition("]:")
+        return host.rstrip("]"), int(port) if port else default_port
+
+    if address.count(":") == 1:
+        host, port = address.split(":")
+        return host, int(port)
+
+    return address, default_port
+
+
+async def probe_tcp(host: str, port: int, timeout: float) -> Optional[float]:
+    """Return the TCP connect latency to `host:port`, or None if unreachable."""
+    start = time.monotonic()
+
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+
+    except (OSError, asyncio.TimeoutError):
+        return None
+
+    latency = time.monotonic() - start
+
+    writer.close()
+
+    try:
+        await writer.wait_closed()
+
+    except OSError:
+        pass
+
+    return latency
+
+
+class SeedHealth:
+    """Reachability history of a single seed node."""
+
+    __slots__ = ("address", "latency", "rpc_up", "history")
+
+    def __init__(self, address: str):
+        self.address: str = address
+        self.latency: Optional[float] = None
+        self.rpc_up: Optional[bool] = None
+        self.history: deque[bool] = deque(maxlen=SEED_HISTORY_LENGTH)
+
+    @property
+    def up(self) -> bool:
+        return bool(self.history) and self.history[-1]
+
+    @property
+    def uptime(self) -> float:
+        return sum(self.history) / len(self.history) if self.history else 0.0
+
+    def record(self, latency: Optional[float]) -> None:
+        self.latency = latency
+        self.history.append(latency is not None)
+
+
+class SeedProber:
+    """Concurrent TCP (and optional RPC) reachability prober for seed nodes."""
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        rpc_port: Optional[int] = None,
+        concurrency: int = SEED_PROBE_CONCURRENCY,
+        timeout: float = SEED_PROBE_TIMEOUT,
+    ):
+        self.session: Optional[aiohttp.ClientSession] = session
+        self.rpc_port: Optional[int] = rpc_port
+        self.concurrency: int = concurrency
+        self.timeout: float = timeout
+        self._seeds: dict[str, SeedHealth] = dict()
+
+    @property
+    def seeds(self) -> list[SeedHealth]:
+        return list(self._seeds.values())
+
+    def ranked(self) -> list[SeedHealth]:
+        """Seeds ordered from healthiest to least healthy."""
+        return sorted(
+            self._seeds.values(),
+            key=lambda seed: (
+                not seed.up,
+                -seed.uptime,
+                seed.latency if seed.latency is not None else float("inf"),
+            ),
+        )
+
+    async def _probe(self, seed: SeedHealth, semaphore: asyncio.Semaphore) -> None:
+        host, port = split_address(seed.address)
+
+        async with semaphore:
+            seed.record(await probe_tcp(host, port, self.timeout))
+
+            if self.session is None or self.rpc_port is None or not seed.up:
+                return
+
+            try:
+                await fetch_json(
+                    self.session,
+                    f"http://{host}:{self.rpc_port}/get_height",
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                )
+                seed.rpc_up = True
+
+            except Exception:
+                seed.rpc_up = False
+
+    async def probe(self, addresses: Iterable[str]) -> None:
+        """Probe every address, keeping history for seeds seen before."""
+        seeds = {
+            address: self._seeds.get(address) or SeedHealth(address)
+            for address in dict.fromkeys(addresses)
+        }
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        await asyncio.gather(
+            *(self._probe(seed, semaphore) for seed in seeds.values())
+        )
+
+        # Published only once probed, so new seeds are never listed as down.
+        self._seeds = seeds
@@ -2,35 +2,91 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
 
+import time
+from datetime import UTC, datetime
+
 import discord
-from discord.ext.menus import ListPageSource
+from discord.ext.menus import PageSource, ListPageSource
 
 from utils.tools import calculate_banned_time_from_seconds
 
 if TYPE_CHECKING:
+    from motor.motor_asyncio import (
+        AsyncIOMotorCollection,
+        AsyncIOMotorCommandCursor,
+    )
+
     from discord.ext.menus import Menu
 
+    from utils.market import Ticker
+
 from config import EMBED_COLOR
 
 
-class HistoricalPricePaginatorSource(ListPageSource):
+class HistoricalPricePaginatorSource(PageSource):
+    """Pages through a historical price cursor as the user navigates.
+
+    Documents are only pulled from the cursor when a page past the ones already
+    seen is requested, and fetched pages are kept so navigating back is free.
+    `total` is an estimate of the number of entries and is corrected once the
+    cursor runs out.
+    """
+
     def __init__(
         self,
-        entries: list,
+        cursor: AsyncIOMotorCommandCursor,
         ctx: discord.Interaction,
-        per_page: Optional[int] = 1,
+        total: int,
+        resolution: str = "day",
+        per_page: Optional[int] = 5,
     ):
-        entries = [tuple(entries[i : i + 5]) for i in range(0, len(entries), 5)]
-        super().__init__(list(enumerate(entries, 1)), per_page=per_page)
-
+        self.cursor = cursor
         self.ctx = ctx
-        self.total_pages = len(entries)
+        self.resolution = resolution
+        self.per_page = per_page
+        self.total_pages = max(1, -(-total // per_page))
+        self._pages: list[list[dict[str, Any]]] = list()
+        self._exhausted = False
+
+    async def prepare(self) -> None:
+        await self._fill(0)
+
+    async def _fill(self, page_number: int) -> None:
+        while len(self._pages) <= page_number and not self._exhausted:
+            documents = await self.cursor.to_list(length=self.per_page)
+
+            if documents:
+                self._pages.append(documents)
+
+            if len(documents) < self.per_page:
+                self._exhausted = True
+                self.total_pages = max(1, len(self._pages))
+
+    def is_paginating(self) -> bool:
+        return True
+
+    def get_max_pages(self) -> int:
+        return self.total_pages
+
+    @property
+    def empty(self) -> bool:
+        return self._exhausted and not self._pages
+
+    async def get_page(self, page_number: int) -> Any:
+        await self._fill(page_number)
+
+        # `total` is only an estimate, so pages past the cursor's end do not exist.
+        # Menus ignore the IndexError and stay on the current page.
+        if page_number >= len(self._pages):
+            raise IndexError(page_number)
+
+        return page_number + 1, self._pages[page_number]
 
     async def format_page(self, menu: Menu, item: Any) -> discord.Embed:
         page_no, item = item
 
         embed = discord.Embed(colour=EMBED_COLOR)
-        embed.title = f"Nerva Historical Price Data"
+        embed.title = f"Nerva Historical Price Data ({self.resolution})"
 
         embed.set_author(name="RoboNerva", icon_url=self.ctx.guild.me.avatar.url)
         embed.set_thumbnail(
@@ -40,14 +96,20 @@ class HistoricalPricePaginatorSource(ListPageSource):
 
         for entry in item:
             embed.add_field(
-                name=entry["date"].strftime("%Y-%m-%d"),
+                name=entry["_id"].strftime(
+                    "%Y-%m-%d %H:00" if self.resolution == "hour" else "%Y-%m-%d"
+                ),
                 value=f"```css\n"
                 f"Opening price: ${entry['opening']}\n"
                 f"Closing price: ${entry['closing']}\n"
                 f"High price: ${entry['high']}\n"
                 f"Low price: ${entry['low']}\n"
-                f"Volume: ${entry['volume']}\n"
-                f"```",
+                + (
+                    f"Volume: ${entry['volume']}\n"
+                    if entry.get("volume") is not None
+                    else ""
+                )
+                + "```",
                 inline=False,
             )
 
@@ -57,18 +119,16 @@ class HistoricalPricePaginatorSource(ListPageSource):
 
         return embed
 
-    def is_paginating(self) -> bool:
-        return True
-
 
 class NervaExchangePaginatorSource(ListPageSource):
     def __init__(
         self,
-        entries: list,
+        entries: list[Ticker],
         ctx: discord.Interaction,
         exchange_name: str,
         exchange_urls: dict[str, Any],
         thumbnail_url: str,
+        fetched_at: Optional[float] = None,
         per_page: Optional[int] = 1,
     ):
         super().__init__(list(enumerate(entries, 1)), per_page=per_page)
@@ -77,6 +137,7 @@ class NervaExchangePaginatorSource(ListPageSource):
         self.exchange_name = exchange_name
         self.exchange_urls = exchange_urls
         self.thumbnail_url = thumbnail_url
+        self.fetched_at = fetched_at
         self.total_pages = len(entries)
 
     async def format_page(self, menu: Menu, item: Any) -> discord.Embed:
@@ -84,58 +145,63 @@ class NervaExchangePaginatorSource(ListPageSource):
 
         embed = discord.Embed(colour=EMBED_COLOR)
 
-        embed.title = f"{item['pair']} on {self.exchange_name}"
-        embed.url = self.exchange_urls[item["pair"]]
+        embed.title = f"{item.pair} on {self.exchange_name}"
+        embed.url = self.exchange_urls.get(item.pair)
 
         embed.set_author(name="RoboNerva", icon_url=self.ctx.guild.me.avatar.url)
         embed.set_thumbnail(url=self.thumbnail_url)
 
         embed.add_field(
             name="Last Price",
-            value=item.get("last_price", "N/A"),
+            value=item.last_price,
         )
 
-        if item.get("bid"):
+        if item.bid:
             embed.add_field(
                 name="Bid",
-                value=item["bid"],
+                value=item.bid,
             )
 
-        if item.get("ask"):
+        if item.ask:
             embed.add_field(
                 name="Ask",
-                value=item["ask"],
+                value=item.ask,
             )
 
         embed.add_field(
             name="Volume",
-            value=item.get("volume", "N/A"),
+            value=item.volume,
         )
 
         embed.add_field(
             name="High",
-            value=item.get("high", "N/A"),
+            value=item.high,
         )
 
         embed.add_field(
             name="Low",
-            value=item.get("low", "N/A"),
+            value=item.low,
         )
 
-        if item.get("change_24h"):
+        if item.change_24h:
             embed.add_field(
                 name="Change (24h)",
-                value=item["change_24h"],
+                value=item.change_24h,
             )
 
-        if item.get("last_trade"):
+        if item.last_trade:
             embed.add_field(
                 name="Last Trade",
-                value=f"<t:{item['last_trade']}:R>",
+                value=f"<t:{item.last_trade}:R>",
             )
 
+        footer = f"Page {page_no}/{self.total_pages}"
+
+        if self.fetched_at is not None:
+            footer += f" | Updated {int(time.time() - self.fetched_at)}s ago"
+
         embed.set_footer(
-            text=f"Page {page_no}/{self.total_pages} | Use \u25c0\ufe0f and \u25b6\ufe0f to navigate through the entries & \u23f9\ufe0f to stop the pagination"
+            text=f"{footer} | Use \u25c0\ufe0f and \u25b6\ufe0f to navigate through the entries & \u23f9\ufe0f to stop the pagination"
         )
 
         return embed
@@ -144,37 +210,74 @@ class NervaExchangePaginatorSource(ListPageSource):
         return True
 
 
-class IPBanPaginatorSource(ListPageSource):
+class IPBanPaginatorSource(PageSource):
+    """Pages through the ban registry, fetching only the page being shown."""
+
     def __init__(
         self,
-        entries: list,
+        collection: AsyncIOMotorCollection,
         ctx: discord.Interaction,
-        per_page: Optional[int] = 1,
+        query: dict[str, Any],
+        sort: list[tuple[str, int]],
+        total: int,
+        per_page: Optional[int] = 10,
     ):
-        super().__init__(list(enumerate(entries, 1)), per_page=per_page)
-
+        self.collection = collection
         self.ctx = ctx
-        self.total_pages = len(entries)
+        self.query = query
+        self.sort = sort
+        self.total = total
+        self.per_page = per_page
+        self.total_pages = max(1, -(-total // per_page))
+
+    def is_paginating(self) -> bool:
+        return True
+
+    def get_max_pages(self) -> int:
+        return self.total_pages
+
+    async def get_page(self, page_number: int) -> Any:
+        documents = (
+            await self.collection.find(self.query)
+            .sort(self.sort)
+            .skip(page_number * self.per_page)
+            .limit(self.per_page)
+            .to_list(length=self.per_page)
+        )
+
+        return page_number + 1, documents
 
     async def format_page(self, menu: Menu, item: Any) -> discord.Embed:
-        page_no, item = item
+        page_no, documents = item
 
         embed = discord.Embed(color=EMBED_COLOR)
-        embed.title = f"IP {item['host']}"
+        embed.title = "IP Bans"
 
         embed.set_author(name="RoboNerva", icon_url=self.ctx.guild.me.avatar.url)
 
-        embed.add_field(name="IP Int32", value=item["ip"])
-        embed.add_field(name="Reason", value=item["reason"])
-        embed.add_field(
-            name="Time Remaining",
-            value=f"```css\n{calculate_banned_time_from_seconds(item['seconds'])}```",
-            inline=False,
-        )
+        now = datetime.now(UTC)
 
-        embed.set_footer(text=f"Entry {page_no}/{self.total_pages}")
+        for document in documents:
+            seconds = max(
+                0,
+                int(
+                    (
+                        document["expires_at"].replace(tzinfo=UTC) - now
+                    ).total_seconds()
+                ),
+            )
 
-        return embed
+            embed.add_field(
+                name=document["_id"],
+                value=f"```css\n"
+                f"Reason: {document['reason']}\n"
+                f"Remaining: {calculate_banned_time_from_seconds(seconds)}\n"
+                f"```",
+                inline=False,
+            )
 
-    def is_paginating(self) -> bool:
-        return True
+        embed.set_footer(
+            text=f"Page {page_no}/{self.total_pages} | {self.total} bans"
+        )
+
+        return embed
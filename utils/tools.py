@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import validators
 
 import discord
 
+if TYPE_CHECKING:
+    from utils.nodes import NodeResult
+
 from config import ADMIN_ROLE_IDS, DEVELOPER_USER_IDS
 
 
@@ -38,10 +43,13 @@ def validate_ip_address(ip: str) -> bool:
     return validators.ipv4(ip) or validators.ipv6(ip)
 
 
-def calculate_hashrate(difficulty: int) -> str:
-    """Calculate network hashrate."""
-    hr = difficulty / 60
+def is_hash(value: str) -> bool:
+    """Check if value is a block or transaction hash."""
+    return len(value) == 64 and all(c in "0123456789abcdef" for c in value.lower())
 
+
+def format_hashrate(hr: float) -> str:
+    """Format hashrate."""
     res = f"{hr:.2f} H/s"
 
     if hr > 1_000:
@@ -96,3 +104,18 @@ def calculate_seconds_from_time_string(time_string: str) -> int:
             seconds += int(t[:-1]) * 86400
 
     return seconds
+
+
+def format_node_results(results: list[NodeResult]) -> str:
+    """Format fan-out results as a per-node table."""
+    width = max((len(result.url) for result in results), default=4)
+
+    lines = [f"{'Node':<{width}}  {'Status':<7}  Latency"]
+
+    for result in results:
+        lines.append(
+            f"{result.url:<{width}}  {result.status:<7}  "
+            f"{int(result.latency * 1000)} ms"
+        )
+
+    return "```\n" + "\n".join(lines) + "\n```"